@@ -1,74 +1,111 @@
 from __future__ import annotations
 
+import heapq
 import re
 from datetime import datetime, timedelta, timezone
-from typing import Iterable, List, Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
 
-import pandas as pd
+_HOUR_RE = re.compile(r"(\d+)\s*(hour|小时)")
+_MIN_RE = re.compile(r"(\d+)\s*(min|minute|分钟)")
+_DAY_RE = re.compile(r"(\d+)\s*(day|天)")
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
 
+_UTC = timezone.utc
 
-def parse_relative_time(text: str) -> Optional[datetime]:
+
+def parse_relative_time(text: str, now: Optional[datetime] = None) -> Optional[datetime]:
     if not text:
         return None
-    text = text.strip().lower()
-    now = datetime.now(timezone.utc)
+    offset = _parse_relative_offset(text.strip().lower())
+    if offset is None or isinstance(offset, datetime):
+        return offset
+    return (now or datetime.now(timezone.utc)) - offset
+
+
+@lru_cache(maxsize=256)
+def _parse_relative_offset(text: str) -> Union[timedelta, datetime, None]:
+    # 返回相对 now 的偏移量（或绝对日期），与 now 无关，因此可以安全缓存
     if "today" in text or "今天" in text:
-        return now
+        return timedelta(0)
     if "yesterday" in text or "昨天" in text:
-        return now - timedelta(days=1)
-    hour_match = re.search(r"(\d+)\s*(hour|小时)", text)
-    if hour_match:
-        return now - timedelta(hours=int(hour_match.group(1)))
-    min_match = re.search(r"(\d+)\s*(min|minute|分钟)", text)
-    if min_match:
-        return now - timedelta(minutes=int(min_match.group(1)))
-    day_match = re.search(r"(\d+)\s*(day|天)", text)
-    if day_match:
-        return now - timedelta(days=int(day_match.group(1)))
-    date_match = re.search(r"(\d{4}-\d{2}-\d{2})", text)
-    if date_match:
-        try:
-            return datetime.fromisoformat(date_match.group(1)).replace(tzinfo=timezone.utc)
-        except ValueError:
-            return None
+        return timedelta(days=1)
+    # 先用子串判断单位是否出现，再调用正则
+    if "hour" in text or "小时" in text:
+        hour_match = _HOUR_RE.search(text)
+        if hour_match:
+            return timedelta(hours=int(hour_match.group(1)))
+    if "min" in text or "分钟" in text:
+        min_match = _MIN_RE.search(text)
+        if min_match:
+            return timedelta(minutes=int(min_match.group(1)))
+    if "day" in text or "天" in text:
+        day_match = _DAY_RE.search(text)
+        if day_match:
+            return timedelta(days=int(day_match.group(1)))
+    if "-" in text:
+        date_match = _DATE_RE.search(text)
+        if date_match:
+            year, month, day = date_match.groups()
+            try:
+                return datetime(int(year), int(month), int(day), tzinfo=_UTC)
+            except ValueError:
+                return None
     return None
 
 
 def filter_recent(items: Iterable[dict], max_hours: int = 48) -> List[dict]:
     rows = []
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=max_hours)
+    now = datetime.now(timezone.utc)
+    cutoff_ts = (now - timedelta(hours=max_hours)).timestamp()
     for item in items:
         published_at = item.get("published_at")
-        if not published_at and item.get("raw_date"):
-            published_at = parse_relative_time(item.get("raw_date", ""))
-        if published_at and published_at >= cutoff:
+        if not published_at:
+            raw_date = item.get("raw_date")
+            if raw_date:
+                published_at = parse_relative_time(raw_date, now=now)
+        if published_at and published_at.timestamp() >= cutoff_ts:
             item["published_at"] = published_at
             rows.append(item)
     return rows
 
 
 def deduplicate(items: Iterable[dict]) -> List[dict]:
-    df = pd.DataFrame(items)
-    if df.empty:
-        return []
-    df["key"] = (
-        df["name"].fillna("").str.lower().str.strip()
-        + "|"
-        + df["url"].fillna("").str.lower().str.strip()
-    )
-    df = df.drop_duplicates(subset=["key"])
-    return df.drop(columns=["key"]).to_dict(orient="records")
+    seen = set()
+    output = []
+    for item in items:
+        key = (
+            (item.get("name") or "").lower().strip(),
+            (item.get("url") or "").lower().strip(),
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        output.append(item)
+    return output
 
 
 def parse_traffic_value(value: str) -> float:
     if not value:
         return 0.0
     value = value.replace(",", "").lower()
-    match = re.search(r"([\d.]+)\s*([km]?)", value)
-    if not match:
+    length = len(value)
+    # 手写扫描代替正则：定位第一个数字串，再看紧随其后的 k/m 单位
+    start = 0
+    while start < length and not (value[start].isdecimal() or value[start] == "."):
+        start += 1
+    end = start
+    while end < length and (value[end].isdecimal() or value[end] == "."):
+        end += 1
+    if start == end:
+        return 0.0
+    try:
+        number = float(value[start:end])
+    except ValueError:
         return 0.0
-    number = float(match.group(1))
-    suffix = match.group(2)
+    while end < length and value[end].isspace():
+        end += 1
+    suffix = value[end] if end < length else ""
     if suffix == "k":
         return number * 1_000
     if suffix == "m":
@@ -86,26 +123,23 @@ def apply_aicpb_filter(
     if not rankings_list:
         return list(items)
 
-    df = pd.DataFrame(rankings_list)
-    df["traffic_value"] = df["traffic"].apply(parse_traffic_value)
-    df = df.sort_values("traffic_value")
-    tail_size = max(1, int(len(df) * tail_ratio))
-    tail = df.head(tail_size)
-    low_tail = tail[tail["traffic_value"] <= low_traffic_threshold]
-    zombie_names = set(low_tail["name"].str.lower().str.strip())
+    parsed = [
+        (parse_traffic_value(row.get("traffic", "")), row.get("name") or "")
+        for row in rankings_list
+    ]
+    tail_size = max(1, int(len(parsed) * tail_ratio))
+    tail = heapq.nsmallest(tail_size, parsed, key=lambda pair: pair[0])
+    zombie_names = {
+        name.lower().strip() for value, name in tail if value <= low_traffic_threshold
+    }
 
-    filtered = []
-    for item in items:
-        name = item.get("name", "").lower().strip()
-        if name in zombie_names:
-            continue
-        filtered.append(item)
-    return filtered
+    return [
+        item for item in items if item.get("name", "").lower().strip() not in zombie_names
+    ]
 
 
 def select_top(items: Iterable[dict], limit: int = 10) -> List[dict]:
-    df = pd.DataFrame(items)
-    if df.empty:
-        return []
-    df = df.sort_values("published_at", ascending=False)
-    return df.head(limit).to_dict(orient="records")
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    return heapq.nlargest(
+        limit, items, key=lambda item: item.get("published_at") or oldest
+    )
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # 可选依赖，缺失时回退到标准库 json
+    orjson = None
+
 DEFAULT_CONFIG = {
     "webhook_url": "",
     "schedule_time": "09:00",
@@ -18,8 +24,30 @@ DEFAULT_CONFIG = {
 }
 
 
+# 按优先级排列的候选环境变量
+_LLM_KEY_ENVS = ("DEEPSEEK_API_KEY", "LLM_API_KEY", "OPENAI_API_KEY", "OPENROUTER_API_KEY")
+_WEBHOOK_ENVS = ("REPORT_WEBHOOK_URL", "FEISHU_WEBHOOK", "KDOCS_WEBHOOK", "SLACK_WEBHOOK")
+
+# 参与配置合并的环境变量，其取值也作为缓存键的一部分
+_CONFIG_ENV_KEYS = _LLM_KEY_ENVS + _WEBHOOK_ENVS + (
+    "LLM_BASE_URL", "LLM_MODEL", "PH_API_TOKEN", "TAVILY_API_KEY",
+)
+
+
 def _env_default(key: str, fallback: str = "") -> str:
-    return os.getenv(key, "").strip() or fallback
+    value = os.environ.get(key)
+    if value:
+        value = value.strip()
+    return value or fallback
+
+
+def _first_env(keys: tuple[str, ...]) -> str:
+    """按顺序返回第一个非空的环境变量值"""
+    for key in keys:
+        value = _env_default(key)
+        if value:
+            return value
+    return ""
 
 
 def load_config(path: str = "config.json") -> dict[str, Any]:
@@ -32,40 +60,44 @@ def load_config(path: str = "config.json") -> dict[str, Any]:
     - LLM_MODEL: LLM 模型名称
     - TAVILY_API_KEY: Tavily 搜索 API Key
     - REPORT_WEBHOOK_URL / FEISHU_WEBHOOK: Webhook 推送地址
+
+    结果按 (路径, 修改时间, 环境变量) 缓存，文件变更或环境变量变化后自动失效。
     """
-    def _get_llm_key() -> str:
-        return (_env_default("DEEPSEEK_API_KEY") or 
-                _env_default("LLM_API_KEY") or 
-                _env_default("OPENAI_API_KEY") or
-                _env_default("OPENROUTER_API_KEY"))
-    
-    def _get_webhook() -> str:
-        # 优先返回第一个非空的 webhook
-        return (_env_default("REPORT_WEBHOOK_URL") or
-                _env_default("FEISHU_WEBHOOK") or
-                _env_default("KDOCS_WEBHOOK") or
-                _env_default("SLACK_WEBHOOK"))
-    
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    env_snapshot = tuple(os.environ.get(key, "") for key in _CONFIG_ENV_KEYS)
+    # 返回副本，避免调用方修改污染缓存
+    return dict(_load_config_cached(os.path.abspath(path), mtime_ns, env_snapshot))
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(
+    path: str, mtime_ns: int, env_snapshot: tuple[str, ...]
+) -> dict[str, Any]:
+    """实际的加载逻辑；mtime_ns 与 env_snapshot 仅用作缓存键"""
     if not os.path.exists(path):
         merged = DEFAULT_CONFIG.copy()
-        merged["webhook_url"] = _get_webhook()
-        merged["llm_api_key"] = _get_llm_key()
+        merged["webhook_url"] = _first_env(_WEBHOOK_ENVS)
+        merged["llm_api_key"] = _first_env(_LLM_KEY_ENVS)
         merged["llm_base_url"] = _env_default("LLM_BASE_URL", DEFAULT_CONFIG["llm_base_url"])
         merged["llm_model"] = _env_default("LLM_MODEL", DEFAULT_CONFIG["llm_model"])
         merged["ph_api_token"] = _env_default("PH_API_TOKEN")
         merged["tavily_api_key"] = _env_default("TAVILY_API_KEY")
         return merged
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         if isinstance(data, dict):
             merged = DEFAULT_CONFIG.copy()
             merged.update({k: v for k, v in data.items() if v is not None})
             # 环境变量优先级更高
-            env_llm_key = _get_llm_key()
+            env_llm_key = _first_env(_LLM_KEY_ENVS)
             if env_llm_key:
                 merged["llm_api_key"] = env_llm_key
-            env_webhook = _get_webhook()
+            env_webhook = _first_env(_WEBHOOK_ENVS)
             if env_webhook:
                 merged["webhook_url"] = env_webhook
             env_tavily = _env_default("TAVILY_API_KEY")
@@ -87,5 +119,9 @@ def load_config(path: str = "config.json") -> dict[str, Any]:
 
 def save_config(config: dict[str, Any], path: str = "config.json") -> None:
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if orjson:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(config, f, ensure_ascii=False, indent=2)
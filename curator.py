@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
+import html
 import json
 import logging
 import os
 import re
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from cleaner import deduplicate, select_top
 from fetchers import (
@@ -20,183 +31,420 @@ from fetchers import (
 from llm_client import LLMClient
 from scraper import ProductItem, Scraper
 
+# _clean_for_llm / _clean_description 使用的正则，模块加载时编译一次
+_RE_TIMESTAMP = re.compile(r'\d+\s*(days?|hours?|minutes?|mins?|hrs?)\s*ago', re.I)
+_RE_META = re.compile(r'(Discussion|Comments?|Link|Source:|Updated:|Created:)[^\n]*', re.I)
+_RE_MD_LINK = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_RE_BADGE = re.compile(r'!\[.*?\]\(.*?\)')
+_RE_IMG = re.compile(r'<img[^>]*>', re.I)
+_RE_STARS = re.compile(r'[⭐★☆]\s*\d+[kK]?')
+_RE_COUNTS = re.compile(r'\b\d+\s*(stars?|forks?|watchers?)\b', re.I)
+_RE_HTML = re.compile(r'<[^>]+>')
+_RE_WS = re.compile(r'\s+')
+_RE_TRAIL = re.compile(r'\s*[|\-–—]\s*$')
+_RE_MULTI_SPACE = re.compile(r"\s{2,}")
+# CJK 统一表意文字基本区，用于判断文本是否含中文
+_HAN_RE = re.compile(r'[\u4e00-\u9fff]')
+
+# _fallback_search 只读取主页开头这么多字节，meta 标签几乎都在 <head> 内
+_META_SNIFF_BYTES = 16 * 1024
+_RE_META_TAG = re.compile(r'<meta\b[^>]*>', re.I)
+_RE_META_NAME_DESC = re.compile(r'\bname\s*=\s*["\']?description["\'\s/>]', re.I)
+_RE_META_CONTENT = re.compile(r'\bcontent\s*=\s*(["\'])(.*?)\1', re.I | re.S)
+
+try:
+    import ahocorasick
+except ImportError:  # 可选依赖，缺失时退回预编译正则
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+
+# 运行期磁盘缓存目录（不入库，见 .gitignore）
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cache")
+
+# Tavily 补充信息的磁盘缓存：30 天过期，最多保留 10k 条（LRU 淘汰）
+_ENRICH_CACHE_TTL = 30 * 24 * 3600
+_ENRICH_CACHE_MAX = 10_000
+# select_top_n 结果缓存：同一批候选 24 小时内重跑（如看板「立即运行」）直接复用上次的选择
+_PICKS_CACHE_TTL = 24 * 3600
+# 候选自带描述达到这个长度就不再为它调用 Tavily（GitHub 项目除外）
+_RICH_DESCRIPTION_CHARS = 160
+
+
+def _read_json_bytes(path: str):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _write_json(path: str, data) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if orjson:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _fetch_concurrently(jobs: List[Tuple[Callable[..., List[dict]], dict]]) -> List[List[dict]]:
+    """并发执行各来源抓取（均为网络 I/O，线程等待时释放 GIL），按 jobs 顺序返回结果"""
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(fetch, **kwargs) for fetch, kwargs in jobs]
+        return [future.result() for future in futures]
+
+
+def _build_scanner(categories: dict[str, Iterable[str]]) -> Callable[[str], dict[str, str]]:
+    """把各类别关键词合并成一个多模式子串扫描器，返回 {命中类别: 触发的关键词}
+
+    关键词先反转成 keyword -> 类别集合，同一个词出现在多个黑名单里也只匹配一次，
+    每个 haystack 只需一次 C 层扫描。优先使用 Aho-Corasick 自动机；未安装
+    pyahocorasick 时退回单个预编译的正则交替式。
+    """
+    kw_to_cats: dict[str, set[str]] = {}
+    for category, keywords in categories.items():
+        for keyword in keywords:
+            kw_to_cats.setdefault(keyword, set()).add(category)
+    if not kw_to_cats:
+        return lambda haystack: {}
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword, cats in kw_to_cats.items():
+            automaton.add_word(keyword, (keyword, frozenset(cats)))
+        automaton.make_automaton()
+
+        def _scan(haystack: str) -> dict[str, str]:
+            hits: dict[str, str] = {}
+            for _, (keyword, cats) in automaton.iter(haystack):
+                for category in cats:
+                    hits.setdefault(category, keyword)
+            return hits
+
+        return _scan
+    # 前瞻交替式在每个位置只报告最长的关键词；同一位置命中的较短关键词都是它的前缀，
+    # 因此把所有前缀关键词的类别并入，保证结果与逐词子串判断一致
+    closure = {
+        keyword: [
+            (category, keyword[:i])
+            for i in range(1, len(keyword) + 1)
+            if keyword[:i] in kw_to_cats
+            for category in kw_to_cats[keyword[:i]]
+        ]
+        for keyword in kw_to_cats
+    }
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(k) for k in sorted(kw_to_cats, key=len, reverse=True)) + "))"
+    )
+
+    def _search(haystack: str) -> dict[str, str]:
+        hits: dict[str, str] = {}
+        for match in pattern.finditer(haystack):
+            for category, keyword in closure[match.group(1)]:
+                hits.setdefault(category, keyword)
+        return hits
+
+    return _search
+
 
 class Curator:
+    # 领域黑名单：包含这些词的产品直接剔除
+    # 【原则】只服务于「搞钱、搞创作、搞效率」场景
+    BLOCK_KEYWORDS = frozenset({
+        # 【开发者工具 - 必杀词】
+        "sdk", "api", "cli", "boilerplate", "template", "starter kit", "starter-kit",
+        "library", "framework", "database", "backend", "frontend", "deploy",
+        "kubernetes", "k8s", "docker", "container", "serverless", "lambda",
+        "agent core", "agentcore", "open source", "open-source", "self-hosted",
+        "devops", "devtool", "developer tool", "infrastructure", "terraform",
+        "npm", "pip", "cargo", "maven", "gradle", "package manager",
+        "python library", "node module", "react component", "vue component",
+        "microservice", "orchestration", "ci/cd", "pipeline",
+        "mcp", "server", "python", "fastmcp", "client", "repo",
+        # 【社交/社区 - 杀无赦】消耗时间的平台
+        "network", "community", "social", "connect", "dating", "meet",
+        "club", "forum", "social media", "social network", "art network",
+        # 【家居/生活 - 杀无赦】
+        "home design", "interior", "decor", "furniture", "reimagine home",
+        "wallpaper", "room design", "house", "garden", "kitchen design",
+        "smart home", "home automation", "iot", "appliance",
+        # 【习惯/日记/情感 - 杀无赦】
+        "habit", "habitz", "habit tracker", "goal tracker", "streak",
+        "journaling", "diary", "mood tracker", "mood",
+        "gratitude", "reflection", "self-care", "mindfulness",
+        "daily routine", "morning routine", "routine",
+        # 【简历/低质量工具】
+        "resume", "cv builder", "resume builder",
+        # 生活/育儿/健康类
+        "baby", "parenting", "infant", "toddler", "pregnancy", "mother", "父母",
+        "health", "fitness", "workout", "exercise", "sleep", "meditation", "wellness",
+        "caffeine", "calorie", "diet", "weight", "nutrition", "yoga", "breathing",
+        # 约会类
+        "girlfriend", "boyfriend", "romance", "love", "match", "relationship",
+        "nsfw", "adult",
+        # 游戏/娱乐类
+        "game", "gaming", "puzzle", "arcade", "casino", "trivia", "quiz game",
+        "tarot", "horoscope", "astrology", "fortune", "zodiac",
+        # 购物/时尚类
+        "shopping", "fashion", "clothing", "beauty", "cosmetic", "skincare",
+        "crypto", "bitcoin", "trading", "stock", "forex", "nft",
+        # 其他生活类
+        "face swap", "protocol",
+        "k12", "k-12", "tutor", "tutoring", "flashcard", "study",
+        "food", "recipe", "cooking", "restaurant", "meal", "grocery",
+        "pet", "dog", "cat", "travel", "vacation", "hotel", "flight",
+        "weather", "calendar", "reminder", "alarm", "timer",
+    })
+    # 通用名黑名单：这些名称太通用，缺乏品牌辨识度
+    GENERIC_NAMES = frozenset({
+        "translator", "3d viewer", "ai chat", "chatbot", "assistant",
+        "converter", "downloader", "editor", "generator", "maker",
+        "ai writer", "text to video", "video generator", "image generator",
+    })
+    # _is_generic_name 使用：通用名出现在词首即命中（与原先 f" {generic}" in f" {lowered} " 等价）
+    _GENERIC_PHRASE_RE = re.compile(
+        r"(?:^| )(?:" + "|".join(map(re.escape, sorted(GENERIC_NAMES, key=len, reverse=True))) + r")"
+    )
+    # 名称只由这些词组成（不超过 3 个）时视为通用名，如 "AI Chat Bot"
+    _GENERIC_TOKENS = frozenset({"ai", "tool", "app", "bot", "assistant", "helper", "generator", "maker", "viewer", "editor"})
+    AICPB_BLOCK_LIST = frozenset({
+        "chatgpt", "claude", "gemini", "copilot",
+        "dall", "openai", "quillbot",
+    })
+    ALLOWED_SOURCES = frozenset({"Toolify", "Product Hunt", "AIBase", "AICPB", "GitHub", "Hacker News", "TAAFT", "Futurepedia"})
+    
+    # 【效率明星白名单】这些巨头产品如果发布 AI 新功能，允许推荐
+    EFFICIENCY_STARS = frozenset({
+        "notion", "raycast", "obsidian", "canva", "figma", "miro",
+        "wps", "feishu", "飞书", "arc", "arc browser",
+        "perplexity", "genspark", "anygen", "linear",
+        "airtable", "coda", "clickup", "monday", "asana",
+        "midjourney", "runway", "pika", "luma", "kling",
+    })
+    
+    # 【开发者工具黑名单】面向开发者的工具，一律拦截
+    # 注意：添加空格前缀避免子字符串误匹配（如 "ide" 匹配 "video"）
+    DEVTOOLS_BLOCKLIST = frozenset({
+        # 部署/运维类 - 绝杀
+        "deploy", "deployment", "backend", "devops", "infrastructure",
+        " server", "hosting", "kubernetes", "docker", "container",
+        "ci/cd", "monitoring", "observability",
+        "serverless", " runtime", "capsule", "capsules",
+        # SDK/API类 - 绝杀
+        " sdk", " api ", "webhook", "endpoint", "rest api", "graphql",
+        " mcp", "fastmcp",  # Model Context Protocol
+        # IDE/编程类 - 绝杀（避免匹配 video/slide）
+        " ide ", "code editor", "debugger", "compiler", " terminal",
+        # 数据库类 - 绝杀
+        " database", " sql", "nosql", "postgres", "mongodb", "redis",
+        # 开源基建类 - 绝杀
+        "open source", "open-source", "github repo", "npm package",
+        # 硬件/固件类 - 绝杀
+        "firmware", " hardware", "embedded", " iot", "raspberry",
+        # Agent/Builder 类 - 绝杀（造 App 的，不是用 App 的）
+        "agent builder", "agent platform", "agent framework",
+        "app builder", "workflow builder", "automation builder",
+        "low-code platform", "no-code platform",
+    })
+    
+    # 【基建厂商黑名单】这些公司卖的是基建，不是成品 SaaS
+    VENDOR_BLOCKLIST = frozenset({
+        "netlify", "vercel", "aws", "amazon web services",
+        "azure", "google cloud", "gcp", "cloudflare",
+        "supabase", "docker", "kubernetes", "gitlab",
+        "heroku", "digitalocean", "linode", "fly.io", "railway",
+        "render", "planetscale", "neon", "upstash",
+    })
+    
+    # 【虚拟伴侣/二次元黑名单】PM 不关心电子宠物、虚拟女友
+    COMPANION_BLOCKLIST = frozenset({
+        "companion", "waifu", "live2d", "virtual friend",
+        "girlfriend", "boyfriend", "dating", "roleplay",
+        "anime", "character ai", "soulmate", "vtuber",
+        "virtual pet", "ai friend", "ai girlfriend", "ai boyfriend",
+        "emotional support", "chat companion", "ai companion",
+        "facetime", "video call",  # 除非明确是会议工具
+    })
+    
+    # 【垂直行业黑名单】PM 关注通用工具，不要太垂直的行业
+    VERTICAL_BLOCKLIST = frozenset({
+        # 金融/交易
+        "trading", "trader", "crypto", "bitcoin", "stock", "forex",
+        "investment", "portfolio", "hedge fund", "quantitative",
+        # 医疗/健康
+        "medical", "diagnosis", "healthcare", "clinical", "patient",
+        "hospital", "doctor", "pharmacy", "drug", "symptom",
+        # 法律（除非是通用合同）
+        "legal advice", "lawyer", "attorney", "litigation", "lawsuit",
+        # 房地产
+        "real estate", "property", "mortgage", "rental",
+        # 其他垂直
+        "insurance", "agriculture", "farming", "mining",
+    })
+    
+    # 【基础设施黑名单】Model/Cloud 提供商
+    INFRA_BLOCKLIST = frozenset({
+        "chatgpt", "claude", "gemini", "gpt-4", "gpt-5",
+        "openai", "anthropic", "google ai", "meta ai",
+        "azure", "aws", "gcp", "lambda",
+    })
+
+    # 【开发者必杀词】_is_dev_tool 使用，看到就杀
+    DEV_KILLERS = frozenset({
+        # 基建/运维
+        "deploy", "deployment", "backend", "devops", "infrastructure",
+        "serverless", "hosting", "ci/cd", "cicd",
+        "kubernetes", "k8s", "docker", "container", "terraform",
+        "aws ", "azure ", "gcp ", "lambda", "monitoring", "observability",
+        # 代码/开发
+        " sdk", " api", " cli ", "boilerplate", "starter kit",
+        " library", " framework", " database", " npm", "pip install",
+        "python library", "node module", "open source", "open-source",
+        " git ", "github", "gitlab", "repository", "debugger",
+        " terminal", " shell ", "code editor",
+        # Agent/Builder 平台（造App的工具）
+        "agent builder", "agent platform", "agent framework", "agent core",
+        "app builder", "code generator", "code generation", " mcp",
+        "low-code platform", "no-code platform", "developer tool",
+    })
+
+    # 【产地证据】LLM 标记为 CN 的产品，描述中必须出现其一，否则降级为 Global
+    CN_EVIDENCE = frozenset({
+        "北京", "上海", "深圳", "杭州", "中国", "china", "beijing", "shanghai",
+        "shenzhen", "hangzhou", "icp", "备案", ".cn", "moonshot", "智谱", "百度",
+    })
+
+    # 【多模式匹配】所有类别的关键词合并编译成一个扫描器，每个 haystack 只需线性扫描一次
+    _KEYWORD_CATEGORIES = {
+        "stars": EFFICIENCY_STARS,
+        "block": BLOCK_KEYWORDS,
+        "companion": COMPANION_BLOCKLIST,
+        "vertical": VERTICAL_BLOCKLIST,
+        "vendor": VENDOR_BLOCKLIST,
+        "devtools": DEVTOOLS_BLOCKLIST,
+        "infra": INFRA_BLOCKLIST,
+        "dev_killers": DEV_KILLERS,
+        "cn_evidence": CN_EVIDENCE,
+    }
+    # curate 强制占位的来源顺序，同名产品去重时按此优先保留；不在其中的来源归入 "Other"
+    _SOURCE_PRIORITY = ("Product Hunt", "Toolify", "TAAFT", "Futurepedia", "Hacker News", "GitHub")
+    # _is_giant 的拦截类别，按原有判断顺序排列
+    _GIANT_CATEGORIES = ("companion", "vertical", "vendor", "devtools", "infra")
+    # _fallback_reason 按产品名归类的推荐语模板，按顺序取第一个命中的（子串匹配）
+    _FALLBACK_TEMPLATES = (
+        (re.compile("doc|note|pdf|知识|文档"), "{name} 是一款智能文档处理工具，可提升知识管理效率。"),
+        (re.compile("video|image|art|design|视频|图片"), "{name} 是一款 AI 创作工具，可快速生成专业视觉内容。"),
+        (re.compile("meet|team|project|会议|协作"), "{name} 是一款办公协作工具，可提升团队工作效率。"),
+        (re.compile("write|copy|text|写作|文案"), "{name} 是一款 AI 写作助手，可快速生成高质量文案。"),
+    )
+    # 首次扫描时构建，所有 Curator 实例共享
+    _SCANNER: Optional[Callable[[str], dict[str, str]]] = None
+
+    @classmethod
+    def _get_scanner(cls) -> Callable[[str], dict[str, str]]:
+        if cls._SCANNER is None:
+            cls._SCANNER = _build_scanner(cls._KEYWORD_CATEGORIES)
+        return cls._SCANNER
+
     def __init__(self, scraper: Scraper, llm: LLMClient, store_path: str, history=None) -> None:
         self.scraper = scraper
         self.llm = llm
         self.store_path = store_path
         self.history = history  # HistoryManager 实例，用于永久去重
-        # 领域黑名单：包含这些词的产品直接剔除
-        # 【原则】只服务于「搞钱、搞创作、搞效率」场景
-        self.block_keywords = {
-            # 【开发者工具 - 必杀词】
-            "sdk", "api", "cli", "boilerplate", "template", "starter kit", "starter-kit",
-            "library", "framework", "database", "backend", "frontend", "deploy",
-            "kubernetes", "k8s", "docker", "container", "serverless", "lambda",
-            "agent core", "agentcore", "open source", "open-source", "self-hosted",
-            "devops", "devtool", "developer tool", "infrastructure", "terraform",
-            "npm", "pip", "cargo", "maven", "gradle", "package manager",
-            "python library", "node module", "react component", "vue component",
-            "microservice", "orchestration", "ci/cd", "pipeline",
-            "mcp", "server", "python", "fastmcp", "client", "repo",
-            # 【社交/社区 - 杀无赦】消耗时间的平台
-            "network", "community", "social", "connect", "dating", "meet",
-            "club", "forum", "social media", "social network", "art network",
-            # 【家居/生活 - 杀无赦】
-            "home design", "interior", "decor", "furniture", "reimagine home",
-            "wallpaper", "room design", "house", "garden", "kitchen design",
-            "smart home", "home automation", "iot", "appliance",
-            # 【习惯/日记/情感 - 杀无赦】
-            "habit", "habitz", "habit tracker", "goal tracker", "streak",
-            "journaling", "diary", "mood tracker", "mood",
-            "gratitude", "reflection", "self-care", "mindfulness",
-            "daily routine", "morning routine", "routine",
-            # 【简历/低质量工具】
-            "resume", "cv builder", "resume builder",
-            # 生活/育儿/健康类
-            "baby", "parenting", "infant", "toddler", "pregnancy", "mother", "父母",
-            "health", "fitness", "workout", "exercise", "sleep", "meditation", "wellness",
-            "caffeine", "calorie", "diet", "weight", "nutrition", "yoga", "breathing",
-            # 约会类
-            "girlfriend", "boyfriend", "romance", "love", "match", "relationship",
-            "nsfw", "adult",
-            # 游戏/娱乐类
-            "game", "gaming", "puzzle", "arcade", "casino", "trivia", "quiz game",
-            "tarot", "horoscope", "astrology", "fortune", "zodiac",
-            # 购物/时尚类
-            "shopping", "fashion", "clothing", "beauty", "cosmetic", "skincare",
-            "crypto", "bitcoin", "trading", "stock", "forex", "nft",
-            # 其他生活类
-            "face swap", "protocol",
-            "k12", "k-12", "tutor", "tutoring", "flashcard", "study",
-            "food", "recipe", "cooking", "restaurant", "meal", "grocery",
-            "pet", "dog", "cat", "travel", "vacation", "hotel", "flight",
-            "weather", "calendar", "reminder", "alarm", "timer",
-        }
-        # 通用名黑名单：这些名称太通用，缺乏品牌辨识度
-        self.generic_names = {
-            "translator", "3d viewer", "ai chat", "chatbot", "assistant",
-            "converter", "downloader", "editor", "generator", "maker",
-            "ai writer", "text to video", "video generator", "image generator",
-        }
-        self.aicpb_block_list = {
-            "chatgpt", "claude", "gemini", "copilot",
-            "dall", "openai", "quillbot",
-        }
-        self.allowed_sources = {"Toolify", "Product Hunt", "AIBase", "AICPB", "GitHub", "Hacker News", "TAAFT", "Futurepedia"}
-        
-        # 【效率明星白名单】这些巨头产品如果发布 AI 新功能，允许推荐
-        self.efficiency_stars = {
-            "notion", "raycast", "obsidian", "canva", "figma", "miro",
-            "wps", "feishu", "飞书", "arc", "arc browser",
-            "perplexity", "genspark", "anygen", "linear",
-            "airtable", "coda", "clickup", "monday", "asana",
-            "midjourney", "runway", "pika", "luma", "kling",
-        }
-        
-        # 【开发者工具黑名单】面向开发者的工具，一律拦截
-        # 注意：添加空格前缀避免子字符串误匹配（如 "ide" 匹配 "video"）
-        self.devtools_blocklist = {
-            # 部署/运维类 - 绝杀
-            "deploy", "deployment", "backend", "devops", "infrastructure",
-            " server", "hosting", "kubernetes", "docker", "container",
-            "ci/cd", "monitoring", "observability",
-            "serverless", " runtime", "capsule", "capsules",
-            # SDK/API类 - 绝杀
-            " sdk", " api ", "webhook", "endpoint", "rest api", "graphql",
-            " mcp", "fastmcp",  # Model Context Protocol
-            # IDE/编程类 - 绝杀（避免匹配 video/slide）
-            " ide ", "code editor", "debugger", "compiler", " terminal",
-            # 数据库类 - 绝杀
-            " database", " sql", "nosql", "postgres", "mongodb", "redis",
-            # 开源基建类 - 绝杀
-            "open source", "open-source", "github repo", "npm package",
-            # 硬件/固件类 - 绝杀
-            "firmware", " hardware", "embedded", " iot", "raspberry",
-            # Agent/Builder 类 - 绝杀（造 App 的，不是用 App 的）
-            "agent builder", "agent platform", "agent framework",
-            "app builder", "workflow builder", "automation builder",
-            "low-code platform", "no-code platform",
-        }
-        
-        # 【基建厂商黑名单】这些公司卖的是基建，不是成品 SaaS
-        self.vendor_blocklist = {
-            "netlify", "vercel", "aws", "amazon web services",
-            "azure", "google cloud", "gcp", "cloudflare",
-            "supabase", "docker", "kubernetes", "gitlab",
-            "heroku", "digitalocean", "linode", "fly.io", "railway",
-            "render", "planetscale", "neon", "upstash",
-        }
-        
-        # 【虚拟伴侣/二次元黑名单】PM 不关心电子宠物、虚拟女友
-        self.companion_blocklist = {
-            "companion", "waifu", "live2d", "virtual friend",
-            "girlfriend", "boyfriend", "dating", "roleplay",
-            "anime", "character ai", "soulmate", "vtuber",
-            "virtual pet", "ai friend", "ai girlfriend", "ai boyfriend",
-            "emotional support", "chat companion", "ai companion",
-            "facetime", "video call",  # 除非明确是会议工具
-        }
-        
-        # 【垂直行业黑名单】PM 关注通用工具，不要太垂直的行业
-        self.vertical_blocklist = {
-            # 金融/交易
-            "trading", "trader", "crypto", "bitcoin", "stock", "forex",
-            "investment", "portfolio", "hedge fund", "quantitative",
-            # 医疗/健康
-            "medical", "diagnosis", "healthcare", "clinical", "patient",
-            "hospital", "doctor", "pharmacy", "drug", "symptom",
-            # 法律（除非是通用合同）
-            "legal advice", "lawyer", "attorney", "litigation", "lawsuit",
-            # 房地产
-            "real estate", "property", "mortgage", "rental",
-            # 其他垂直
-            "insurance", "agriculture", "farming", "mining",
-        }
-        
-        # 【基础设施黑名单】Model/Cloud 提供商
-        self.infra_blocklist = {
-            "chatgpt", "claude", "gemini", "gpt-4", "gpt-5",
-            "openai", "anthropic", "google ai", "meta ai",
-            "azure", "aws", "gcp", "lambda",
-        }
+        # store_path 读取结果缓存，写入时失效
+        self._history_cache: Optional[list[dict]] = None
+        self._recent_seen_cache: dict[int, set[str]] = {}
+        # enrich_with_search 的磁盘缓存，首次使用时加载；并发补充信息时用锁保护
+        self._enrich_cache_path = os.path.join(_CACHE_DIR, "enrich_cache.json")
+        self._enrich_cache: Optional[OrderedDict[str, dict]] = None
+        self._enrich_dirty = False
+        self._enrich_stats = {"hits": 0, "misses": 0}
+        self._enrich_lock = threading.Lock()
+        # select_top_n 结果的磁盘缓存，见 _select_top_n_cached
+        self._picks_cache_path = os.path.join(_CACHE_DIR, "picks_cache.json")
+        # _fallback_search 复用的连接池，并发补充信息时共享 TCP 连接
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+    def __enter__(self) -> "Curator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._http.close()
+
+    def _scan(self, haystack: str, categories: Optional[Iterable[str]] = None) -> dict[str, str]:
+        """扫描 haystack 一次，返回 {命中类别: 触发的关键词}；传入 categories 时只保留这些类别"""
+        hits = self._get_scanner()(haystack)
+        if categories is None:
+            return hits
+        return {category: hits[category] for category in categories if category in hits}
 
     def _load_history(self) -> list[dict]:
-        if not os.path.exists(self.store_path):
-            return []
+        if self._history_cache is None:
+            self._history_cache = self._read_history()
+        return self._history_cache
+
+    def _read_history(self) -> list[dict]:
         try:
-            with open(self.store_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json_bytes(self.store_path)
             if isinstance(data, list):
                 return data
+        except FileNotFoundError:
+            return []
         except Exception as exc:  # noqa: BLE001
             logging.warning("Failed to load history: %s", exc)
         return []
 
     def _save_history(self, items: list[dict]) -> None:
-        os.makedirs(os.path.dirname(self.store_path), exist_ok=True)
-        with open(self.store_path, "w", encoding="utf-8") as f:
-            json.dump(items, f, ensure_ascii=False, indent=2)
+        _write_json(self.store_path, items)
+        self._invalidate_history_cache()
+
+    def _invalidate_history_cache(self) -> None:
+        self._history_cache = None
+        self._recent_seen_cache.clear()
+
+    @staticmethod
+    def _ts_to_epoch(ts) -> Optional[int]:
+        try:
+            dt = datetime.fromisoformat(ts)
+        except Exception:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return int(dt.timestamp())
 
     def _recent_seen(self, days: int = 30) -> set[str]:
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        cached = self._recent_seen_cache.get(days)
+        if cached is not None:
+            return cached
+        cutoff_epoch = int((datetime.now(timezone.utc) - timedelta(days=days)).timestamp())
         seen = set()
         for item in self._load_history():
-            ts = item.get("ts")
-            try:
-                dt = datetime.fromisoformat(ts)
-            except Exception:
-                continue
-            if dt >= cutoff:
+            epoch = item.get("ts_epoch")
+            if epoch is None:
+                # 旧记录只有 ts：解析一次并就地补上 ts_epoch，下次保存时一并写回
+                epoch = self._ts_to_epoch(item.get("ts"))
+                if epoch is None:
+                    continue
+                item["ts_epoch"] = epoch
+            if epoch >= cutoff_epoch:
                 key = (item.get("url") or item.get("name") or "").strip().lower()
                 if key:
                     seen.add(key)
+        self._recent_seen_cache[days] = seen
         return seen
 
     def _append_history(self, selections: list[dict]) -> None:
-        history = self._load_history()
-        now = datetime.now(timezone.utc).isoformat()
+        history = list(self._load_history())
+        now_dt = datetime.now(timezone.utc)
+        now = now_dt.isoformat()
+        now_epoch = int(now_dt.timestamp())
         for item in selections:
             key = (item.get("url") or item.get("name") or "").strip()
             if not key:
@@ -206,42 +454,45 @@ class Curator:
                     "name": item.get("name", ""),
                     "url": item.get("url", ""),
                     "ts": now,
+                    "ts_epoch": now_epoch,
                 }
             )
         self._save_history(history)
 
-    def _clean_description(self, name: str, text: str) -> str:
+    @staticmethod
+    def _clean_description(name: str, text: str) -> str:
         cleaned = (text or "").strip()
         if not cleaned:
             return ""
         if name:
             dup = f"{name} - {name}"
             cleaned = cleaned.replace(dup, name)
-        cleaned = re.sub(r"\s{2,}", " ", cleaned)
+        cleaned = _RE_MULTI_SPACE.sub(" ", cleaned)
         return cleaned.strip()
 
-    def _clean_for_llm(self, text: str) -> str:
+    @staticmethod
+    def _clean_for_llm(text: str) -> str:
         """预清洗文本，移除元数据噪音，给 LLM 更纯净的输入"""
         if not text:
             return ""
         cleaned = text
         # 移除时间戳噪音
-        cleaned = re.sub(r'\d+\s*(days?|hours?|minutes?|mins?|hrs?)\s*ago', '', cleaned, flags=re.I)
+        cleaned = _RE_TIMESTAMP.sub('', cleaned)
         # 移除元数据标签
-        cleaned = re.sub(r'(Discussion|Comments?|Link|Source:|Updated:|Created:)[^\n]*', '', cleaned, flags=re.I)
+        cleaned = _RE_META.sub('', cleaned)
         # 移除 Markdown 链接语法
-        cleaned = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', cleaned)
+        cleaned = _RE_MD_LINK.sub(r'\1', cleaned)
         # 移除 GitHub 徽章/badge 代码
-        cleaned = re.sub(r'!\[.*?\]\(.*?\)', '', cleaned)
-        cleaned = re.sub(r'<img[^>]*>', '', cleaned, flags=re.I)
+        cleaned = _RE_BADGE.sub('', cleaned)
+        cleaned = _RE_IMG.sub('', cleaned)
         # 移除 star/fork 计数
-        cleaned = re.sub(r'[⭐★☆]\s*\d+[kK]?', '', cleaned)
-        cleaned = re.sub(r'\b\d+\s*(stars?|forks?|watchers?)\b', '', cleaned, flags=re.I)
+        cleaned = _RE_STARS.sub('', cleaned)
+        cleaned = _RE_COUNTS.sub('', cleaned)
         # 移除 HTML 标签
-        cleaned = re.sub(r'<[^>]+>', '', cleaned)
+        cleaned = _RE_HTML.sub('', cleaned)
         # 移除多余空白
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = re.sub(r'\s*[|\-–—]\s*$', '', cleaned)
+        cleaned = _RE_WS.sub(' ', cleaned)
+        cleaned = _RE_TRAIL.sub('', cleaned)
         return cleaned.strip()
 
     def _to_candidate(self, item: ProductItem) -> dict:
@@ -259,26 +510,135 @@ class Curator:
             "source": item.source,
         }
 
-    def _to_candidate_dict(self, item: dict) -> dict:
-        desc = self._clean_description(item.get("name", ""), item.get("tagline", ""))
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _candidate_text(name: str, tagline: str) -> Tuple[str, str, str, bool]:
+        """(desc, context, haystack, low_quality)，只依赖 name/tagline，跨次运行复用同一商品的清洗结果"""
+        desc = Curator._clean_description(name, tagline)
         # 预清洗，移除元数据噪音
-        desc = self._clean_for_llm(desc)
-        text = f"{item.get('name','')} {desc}".strip()
-        words = text.split()
+        desc = Curator._clean_for_llm(desc)
+        text = f"{name} {desc}".strip()
+        lowered_desc = desc.lower()
+        # 与 _candidate_haystack 现拼的 "name tagline description" 一致，预先小写化一次
+        haystack = f"{name.lower()} {lowered_desc} {lowered_desc}"
+        return desc, text, haystack, len(text.split()) < 10
+
+    def _to_candidate_dict(self, item: dict) -> dict:
+        name = item.get("name") or ""
+        desc, text, haystack, low_quality = self._candidate_text(name, item.get("tagline", "") or "")
         return {
-            "name": item.get("name", ""),
+            "_haystack": haystack,
+            # 小写名称，curate 中去重、查找时复用
+            "_name_lc": name.lower(),
+            # 热度分，curate 按来源分桶后据此取各来源的最佳候选
+            "_score": self._heat_score(item),
+            "name": name,
             "url": item.get("url", ""),
             "tagline": desc,
             "description": desc,
             "context": text,
-            "low_quality": len(words) < 10,
+            "low_quality": low_quality,
             "tags": item.get("tags", []),
             "source": item.get("source", ""),
         }
 
-    def enrich_with_search(self, name: str, is_github: bool = False) -> str:
+    def enrich_with_search(
+        self,
+        name: str,
+        is_github: bool = False,
+        cached_only: bool = False,
+        errors: Optional[list] = None,
+    ) -> str:
+        """带磁盘缓存的 _search_summary：同一产品 30 天内不重复调用 Tavily
+
+        cached_only: 只查缓存，未命中时直接返回空串，不发起搜索
+        errors: 见 _search_summary
+        """
+        if not name:
+            return ""
+        key = hashlib.sha256(f"{is_github}\0{name.lower()}".encode("utf-8")).hexdigest()
+        now = int(time.time())
+        with self._enrich_lock:
+            cache = self._load_enrich_cache()
+            entry = cache.get(key)
+            if entry and now - entry.get("ts", 0) < _ENRICH_CACHE_TTL:
+                cache.move_to_end(key)
+                self._enrich_stats["hits"] += 1
+                return entry.get("summary", "")
+            if cached_only:
+                return ""
+            self._enrich_stats["misses"] += 1
+        summary = self._search_summary(name, is_github, errors)
+        # 空结果多为临时失败，不缓存，下次再试
+        if summary:
+            with self._enrich_lock:
+                cache = self._load_enrich_cache()
+                cache[key] = {"summary": summary, "ts": now}
+                cache.move_to_end(key)
+                while len(cache) > _ENRICH_CACHE_MAX:
+                    cache.popitem(last=False)
+                self._enrich_dirty = True
+        return summary
+
+    def _load_enrich_cache(self) -> OrderedDict[str, dict]:
+        """调用方需持有 _enrich_lock；文件中的顺序即 LRU 顺序（最久未用在前）"""
+        if self._enrich_cache is None:
+            try:
+                data = _read_json_bytes(self._enrich_cache_path)
+                self._enrich_cache = OrderedDict(data) if isinstance(data, dict) else OrderedDict()
+            except Exception:  # noqa: BLE001
+                self._enrich_cache = OrderedDict()
+        return self._enrich_cache
+
+    def _flush_enrich_cache(self) -> None:
+        """把本轮新增的补充信息写回磁盘（一轮补充结束后调用一次）"""
+        with self._enrich_lock:
+            if not self._enrich_dirty or self._enrich_cache is None:
+                return
+            try:
+                _write_json(self._enrich_cache_path, self._enrich_cache)
+                self._enrich_dirty = False
+            except OSError as exc:
+                logging.debug("Failed to save enrich cache: %s", exc)
+
+    def _select_top_n_cached(self, llm_input: List[dict]) -> List[dict]:
+        """按 (模型, 候选内容) 的哈希缓存 select_top_n 的结果，命中时省掉一次 LLM 调用"""
+        payload = {
+            "m": getattr(self.llm, "model", ""),
+            "c": sorted(llm_input, key=lambda c: (c.get("name", ""), c.get("url", ""))),
+        }
+        key = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        ).hexdigest()
+        now = time.time()
+        try:
+            cache = _read_json_bytes(self._picks_cache_path)
+            if not isinstance(cache, dict):
+                cache = {}
+        except Exception:  # noqa: BLE001
+            cache = {}
+        entry = cache.get(key)
+        if entry and now - entry.get("ts", 0) < _PICKS_CACHE_TTL:
+            logging.info("LLM picks cache hit, skip select_top_n")
+            return entry.get("picks", [])
+
+        picks = self.llm.select_top_n(llm_input, min_items=3, max_items=4)
+        if picks:
+            # 顺带清掉过期条目，文件只保留最近一天的几条
+            cache = {k: v for k, v in cache.items() if now - v.get("ts", 0) < _PICKS_CACHE_TTL}
+            cache[key] = {"ts": now, "picks": picks}
+            try:
+                _write_json(self._picks_cache_path, cache)
+            except (OSError, TypeError) as exc:
+                logging.debug("Failed to save picks cache: %s", exc)
+        return picks
+
+    def _search_summary(self, name: str, is_github: bool = False, errors: Optional[list] = None) -> str:
         """
         使用 Tavily 深度搜索获取产品信息
+
+        errors: 传入列表时 Tavily 异常追加到其中而不是直接记日志，
+        供线程池调用方回到主线程再输出（看板的日志回调只能在脚本线程里写 session_state）
         
         重点寻找「社会认同」信号：
         - 用户量: "1M+ users", "50k teams"
@@ -329,7 +689,10 @@ class Curator:
                 return self._clean_for_llm(" ".join(summaries)[:800])
             
         except Exception as exc:
-            logging.warning("Tavily search failed for %s: %s", name, exc)
+            if errors is None:
+                logging.warning("Tavily search failed for %s: %s", name, exc)
+            else:
+                errors.append(exc)
         
         # 降级：抓取产品主页 Meta Description
         return self._fallback_search(name)
@@ -350,14 +713,19 @@ class Curator:
         except Exception:
             return ""
     
+    @staticmethod
+    def _meta_description(head: str) -> str:
+        """从 HTML 片段中取第一个 <meta name="description"> 的 content"""
+        for tag in _RE_META_TAG.finditer(head):
+            tag_text = tag.group(0)
+            if _RE_META_NAME_DESC.search(tag_text):
+                match = _RE_META_CONTENT.search(tag_text)
+                return html.unescape(match.group(2)).strip() if match else ""
+        return ""
+
     def _fallback_search(self, name: str) -> str:
         """降级方案：抓取产品主页获取 Meta Description"""
         try:
-            import requests
-            from bs4 import BeautifulSoup
-            
-            # 搜索产品主页
-            search_url = f"https://www.google.com/search?q={name}+official+site"
             headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"}
             # 直接尝试常见域名
             possible_urls = [
@@ -368,13 +736,15 @@ class Curator:
             
             for url in possible_urls[:1]:  # 只尝试第一个
                 try:
-                    resp = requests.get(url, headers=headers, timeout=10)
-                    if resp.status_code == 200:
-                        soup = BeautifulSoup(resp.text, "html.parser")
-                        # 获取 meta description
-                        meta = soup.find("meta", attrs={"name": "description"})
-                        if meta and meta.get("content"):
-                            return self._clean_for_llm(meta["content"])
+                    # 流式读取开头 16KB 即可，不下载、不解析整页
+                    with self._http.get(url, headers=headers, timeout=3, stream=True) as resp:
+                        if resp.status_code != 200:
+                            continue
+                        head = resp.raw.read(_META_SNIFF_BYTES, decode_content=True)
+                        encoding = resp.encoding or "utf-8"
+                    content = self._meta_description(head.decode(encoding, errors="ignore"))
+                    if content:
+                        return self._clean_for_llm(content)
                 except Exception:
                     continue
         except Exception as exc:
@@ -382,64 +752,50 @@ class Curator:
         
         return ""
 
-    def _is_giant(self, name: str, description: str = "") -> bool:
-        """判断是否应该拦截（开发者工具/基建厂商/虚拟伴侣拦截，效率明星放行）"""
-        haystack = f"{name} {description}".lower()
-        
-        # 【效率明星白名单】这些产品如果有 AI 新功能，允许推荐
-        if any(star in haystack for star in self.efficiency_stars):
+    def _is_giant(self, haystack: str, hits: Optional[dict[str, str]] = None) -> bool:
+        """判断是否应该拦截（开发者工具/基建厂商/虚拟伴侣拦截，效率明星放行）
+
+        haystack: 调用方预先拼接并小写化的文本
+        hits: 调用方已对同一 haystack 调用 _scan 的结果，传入时不再重复扫描
+        """
+        if hits is None:
+            hits = self._scan(haystack)
+        # 【效率明星白名单】命中即放行
+        if "stars" in hits:
             return False  # 放行
         
-        # 【虚拟伴侣/二次元黑名单】电子宠物、虚拟女友一律拦截
-        if any(companion in haystack for companion in self.companion_blocklist):
-            return True  # 拦截
-        
-        # 【垂直行业黑名单】太垂直的行业工具一律拦截
-        if any(vertical in haystack for vertical in self.vertical_blocklist):
-            return True  # 拦截
-        
-        # 【基建厂商黑名单】这些公司卖基建，不是成品 SaaS
-        if any(vendor in haystack for vendor in self.vendor_blocklist):
-            return True  # 拦截
-        
-        # 【开发者工具黑名单】面向开发者的工具一律拦截
-        if any(dev in haystack for dev in self.devtools_blocklist):
-            return True  # 拦截
-        
-        # 【基础设施黑名单】Model/Cloud 提供商一律拦截
-        if any(infra in haystack for infra in self.infra_blocklist):
-            return True  # 拦截
-        
-        return False
+        # 【虚拟伴侣 / 垂直行业 / 基建厂商 / 开发者工具 / 基础设施黑名单】一律拦截
+        return any(category in hits for category in self._GIANT_CATEGORIES)
+
+    def _scan_blocked(self, haystack: str, hits: dict[str, str]) -> bool:
+        """通用黑名单或 _is_giant 命中即拦截，hits 为对 haystack 的全类别扫描结果"""
+        return "block" in hits or self._is_giant(haystack, hits)
 
     def _is_generic_name(self, name: str) -> bool:
         """检查产品名是否过于通用，缺乏品牌辨识度"""
         lowered = name.lower().strip()
-        # 完全匹配通用名
-        if lowered in self.generic_names:
+        # 完全匹配通用名，或通用名出现在某个词的开头
+        if lowered in self.GENERIC_NAMES or self._GENERIC_PHRASE_RE.search(lowered):
             return True
-        # 检查是否是单个通用词
-        for generic in self.generic_names:
-            if lowered == generic or f" {generic}" in f" {lowered} ":
-                return True
         # 检查是否只有通用词组成（如 "AI Chat Bot"）
         words = lowered.split()
-        generic_words = {"ai", "tool", "app", "bot", "assistant", "helper", "generator", "maker", "viewer", "editor"}
-        if len(words) <= 3 and all(w in generic_words for w in words):
-            return True
-        return False
+        return len(words) <= 3 and set(words) <= self._GENERIC_TOKENS
+
+    @staticmethod
+    def _candidate_haystack(c: dict) -> str:
+        """取出 _to_candidate_dict 预存的 _haystack（取出即删除，避免随候选发给 LLM），没有则现拼"""
+        return c.pop("_haystack", None) or f"{c.get('name','')} {c.get('tagline','')} {c.get('description','')}".lower()
 
     def _prefilter(self, candidates: List[dict]) -> List[dict]:
         filtered = []
         for c in candidates:
-            haystack = f"{c.get('name','')} {c.get('tagline','')} {c.get('description','')}".lower()
-            if any(k in haystack for k in self.block_keywords):
-                continue
-            desc = f"{c.get('tagline', '')} {c.get('description', '')}"
-            if self._is_giant(c.get("name", ""), desc):
-                continue
+            # 【由廉到贵】只看名称的通用名检查在前，整段文本的关键词扫描在后，打分最后
             if self._is_generic_name(c.get("name", "")):
                 continue
+            haystack = self._candidate_haystack(c)
+            # 拼接、小写化、扫描各一次，所有关键词过滤复用同一结果
+            if self._scan_blocked(haystack, self._scan(haystack)):
+                continue
             score = self.scraper.calculate_quality_score(
                 c.get("name", ""), c.get("tagline", "")
             )
@@ -448,31 +804,18 @@ class Curator:
             filtered.append(c)
         return filtered
 
-    def _is_dev_tool(self, name: str, tagline: str, description: str) -> bool:
-        """检查是否为开发者工具（PM不关心，给开发者用的一律拦截）"""
-        haystack = f"{name} {tagline} {description}".lower()
+    def _is_dev_tool(self, haystack: str, hits: Optional[dict[str, str]] = None) -> bool:
+        """检查是否为开发者工具（PM不关心，给开发者用的一律拦截）
+
+        haystack: 调用方预先拼接并小写化的 "name tagline description"
+        hits: 调用方已对同一 haystack 调用 _scan 的结果，传入时不再重复扫描
+        """
+        if hits is None:
+            hits = self._scan(haystack)
         
         # 【必杀词】看到就杀，无需辩护
-        dev_killers = {
-            # 基建/运维
-            "deploy", "deployment", "backend", "devops", "infrastructure",
-            "serverless", "hosting", "ci/cd", "cicd",
-            "kubernetes", "k8s", "docker", "container", "terraform",
-            "aws ", "azure ", "gcp ", "lambda", "monitoring", "observability",
-            # 代码/开发
-            " sdk", " api", " cli ", "boilerplate", "starter kit",
-            " library", " framework", " database", " npm", "pip install",
-            "python library", "node module", "open source", "open-source",
-            " git ", "github", "gitlab", "repository", "debugger",
-            " terminal", " shell ", "code editor",
-            # Agent/Builder 平台（造App的工具）
-            "agent builder", "agent platform", "agent framework", "agent core",
-            "app builder", "code generator", "code generation", " mcp",
-            "low-code platform", "no-code platform", "developer tool",
-        }
-        for killer in dev_killers:
-            if killer in haystack:
-                return True
+        if "dev_killers" in hits:
+            return True
         
         # 【高危词】需要结合上下文判断
         high_risk = {"builder", "no-code", "low-code"}
@@ -503,17 +846,18 @@ class Curator:
                 logging.debug("Filtered duplicate: %s", name)
                 continue
             
-            haystack = f"{name} {c.get('tagline','')} {c.get('description','')}".lower()
-            if any(k in haystack for k in self.block_keywords):
-                continue
-            desc = f"{c.get('tagline', '')} {c.get('description', '')}"
-            if self._is_giant(name, desc):
-                continue
+            # 【由廉到贵】只看名称的通用名检查在前，整段文本的关键词扫描在后，打分最后
             if self._is_generic_name(name):
                 continue
+            haystack = self._candidate_haystack(c)
+            # 拼接、小写化、扫描各一次，所有关键词过滤复用同一结果
+            hits = self._scan(haystack)
+            if self._scan_blocked(haystack, hits):
+                logging.debug("Filtered by keywords: %s %s", name, hits)
+                continue
             # 【新增】开发者工具过滤
-            if self._is_dev_tool(name, c.get("tagline", ""), c.get("description", "")):
-                logging.debug("Filtered dev tool: %s", name)
+            if self._is_dev_tool(haystack, hits):
+                logging.debug("Filtered dev tool: %s %s", name, hits)
                 continue
             score = self.scraper.calculate_quality_score(
                 name, c.get("tagline", "")
@@ -564,13 +908,13 @@ class Curator:
         now = datetime.now(timezone.utc)
         start_of_day = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
         products: List[dict] = []
-        sources = [
-            fetch_product_hunt_rss(),
-            fetch_toolify_sitemap(),
-            fetch_hacker_news_ai(),
-            fetch_github_ai(),
-            fetch_taaft_timeline(),
-        ]
+        sources = _fetch_concurrently([
+            (fetch_product_hunt_rss, {}),
+            (fetch_toolify_sitemap, {}),
+            (fetch_hacker_news_ai, {}),
+            (fetch_github_ai, {}),
+            (fetch_taaft_timeline, {}),
+        ])
         for items in sources:
             for item in items:
                 published_at = item.get("published_at")
@@ -581,17 +925,16 @@ class Curator:
                 if published_at < start_of_day or published_at > now:
                     continue
                 # 【Part 1 黑名单过滤】
-                tagline = item.get('tagline', '')
-                haystack = f"{item.get('name','')} {tagline} {item.get('url','')}".lower()
-                if not item.get("url") or self._is_giant(item.get("name", ""), tagline):
+                url = item.get("url")
+                if not url:
                     continue
-                if any(k in haystack for k in self.block_keywords):
+                # _is_giant 只看名称与 tagline，黑名单扫描额外带上 url，前缀只小写化一次
+                head = f"{item.get('name','')} {item.get('tagline', '')}".lower()
+                if self._is_giant(head):
                     continue
-                # 【开发者工具过滤】
-                if any(dev in haystack for dev in self.devtools_blocklist):
-                    continue
-                # 【基建厂商过滤】
-                if any(vendor in haystack for vendor in self.vendor_blocklist):
+                haystack = f"{head} {url.lower()}"
+                # 【通用黑名单 / 开发者工具 / 基建厂商过滤】
+                if self._scan(haystack, ("block", "devtools", "vendor")):
                     continue
                 products.append(item)
         products = deduplicate(products)
@@ -601,24 +944,26 @@ class Curator:
     def get_new_products(self) -> List[dict]:
         return self.get_today_news()
 
-    def get_weekly_gems(self) -> List[dict]:
+    def get_weekly_gems(self, exclude: Optional[List[dict]] = None) -> List[dict]:
         """
         Part 2: 获取「已验证质量」的产品（过去 5 天内的高热度产品）
         
         策略：让子弹飞一会儿，筛选经过发酵后脱颖而出的赢家
+
+        exclude: 已取得的 Part 1 结果，传入时不再重新调用 get_today_news
         """
         # 【时间窗口】Part 2 扩展到过去 5 天，给产品时间积累热度
         cutoff = datetime.now(timezone.utc) - timedelta(days=5)
         
         candidates: List[dict] = []
-        sources = [
-            fetch_product_hunt_rss(limit=50),  # 增加数量以便筛选高热度
-            fetch_toolify_sitemap(limit=50),
-            fetch_hacker_news_ai(limit=30),
-            fetch_github_ai(limit=50),  # 增加数量以便筛选高 Star
-            fetch_taaft_timeline(limit=30),
-            fetch_futurepedia(limit=30),
-        ]
+        sources = _fetch_concurrently([
+            (fetch_product_hunt_rss, {"limit": 50}),  # 增加数量以便筛选高热度
+            (fetch_toolify_sitemap, {"limit": 50}),
+            (fetch_hacker_news_ai, {"limit": 30}),
+            (fetch_github_ai, {"limit": 50}),  # 增加数量以便筛选高 Star
+            (fetch_taaft_timeline, {"limit": 30}),
+            (fetch_futurepedia, {"limit": 30}),
+        ])
         
         for items in sources:
             for item in items:
@@ -636,7 +981,7 @@ class Curator:
                         continue
                 
                 tagline = item.get("tagline", "") or item.get("description", "")
-                if self._is_giant(item.get("name", ""), tagline):
+                if self._is_giant(f"{item.get('name', '')} {tagline}".lower()):
                     continue
                 
                 # 【热度硬指标过滤】砍掉冷门产品
@@ -648,9 +993,11 @@ class Curator:
         candidates = deduplicate(candidates)
         
         # 排除 Part 1 已推送的产品
+        if exclude is None:
+            exclude = self.get_today_news()
         part1_keys = {
             (item.get("url") or item.get("name") or "").strip().lower()
-            for item in self.get_today_news()
+            for item in exclude
         }
         candidates = [
             c for c in candidates
@@ -688,18 +1035,19 @@ class Curator:
         # TAAFT/Toolify/Futurepedia/HN：默认通过
         return True
     
+    @staticmethod
+    def _heat_score(item: dict) -> int:
+        source = item.get("source", "")
+        if source == "Product Hunt":
+            return item.get("upvotes", 0) or item.get("votes", 0) or 500
+        if source == "GitHub":
+            return item.get("stars", 0)
+        # 其他来源给基础分
+        return 100
+
     def _sort_by_heat(self, candidates: List[dict]) -> List[dict]:
         """按热度排序：高热度产品排在前面"""
-        def heat_score(item: dict) -> int:
-            source = item.get("source", "")
-            if source == "Product Hunt":
-                return item.get("upvotes", 0) or item.get("votes", 0) or 500
-            if source == "GitHub":
-                return item.get("stars", 0)
-            # 其他来源给基础分
-            return 100
-        
-        return sorted(candidates, key=heat_score, reverse=True)
+        return sorted(candidates, key=self._heat_score, reverse=True)
 
     def _fallback_reason(self, name: str, desc: str) -> str:
         """生成备用推荐语（当 LLM 失败时使用）"""
@@ -715,7 +1063,7 @@ class Curator:
                 tavily_answer = parts[1].strip()
         
         # 如果描述是中文，直接使用
-        if clean_desc and any('\u4e00' <= c <= '\u9fa5' for c in clean_desc):
+        if clean_desc and _HAN_RE.search(clean_desc):
             return clean_desc[:100]
         
         # 尝试用 LLM 单独翻译这个产品
@@ -730,18 +1078,38 @@ class Curator:
         
         # 最终 fallback - 根据产品类型生成简洁描述
         name_lower = name.lower()
-        if any(k in name_lower for k in ["doc", "note", "pdf", "知识", "文档"]):
-            return f"{name} 是一款智能文档处理工具，可提升知识管理效率。"
-        elif any(k in name_lower for k in ["video", "image", "art", "design", "视频", "图片"]):
-            return f"{name} 是一款 AI 创作工具，可快速生成专业视觉内容。"
-        elif any(k in name_lower for k in ["meet", "team", "project", "会议", "协作"]):
-            return f"{name} 是一款办公协作工具，可提升团队工作效率。"
-        elif any(k in name_lower for k in ["write", "copy", "text", "写作", "文案"]):
-            return f"{name} 是一款 AI 写作助手，可快速生成高质量文案。"
-        else:
-            return f"{name} 是一款专注于办公效率的 AI 工具。"
+        for pattern, template in self._FALLBACK_TEMPLATES:
+            if pattern.search(name_lower):
+                return template.format(name=name)
+        return f"{name} 是一款专注于办公效率的 AI 工具。"
+
+    @staticmethod
+    def _has_rich_description(candidate: dict) -> bool:
+        """描述足够长（>= _RICH_DESCRIPTION_CHARS）时 LLM 已有足够信息，可以跳过搜索"""
+        text = max(candidate.get("tagline") or "", candidate.get("description") or "", key=len)
+        return len(text) >= _RICH_DESCRIPTION_CHARS
+
+    def _dedupe_by_name(self, items: List[dict]) -> List[dict]:
+        """按名称去重，保留首次出现的位置；重复项中来源优先级更高的（见 _SOURCE_PRIORITY）替换之"""
+        rank = {source: i for i, source in enumerate(self._SOURCE_PRIORITY)}
+        lowest = len(rank)
+        index: dict[str, int] = {}
+        output: List[dict] = []
+        for item in items:
+            key = item.get("name", "").strip().lower()
+            if not key:
+                output.append(item)
+                continue
+            pos = index.get(key)
+            if pos is None:
+                index[key] = len(output)
+                output.append(item)
+            elif rank.get(item.get("source"), lowest) < rank.get(output[pos].get("source"), lowest):
+                output[pos] = item
+        return output
 
-    def curate(self) -> List[dict]:
+    def curate(self, today: Optional[List[dict]] = None) -> List[dict]:
+        """today: 调用方已取得的 get_today_news 结果，传入时 Part 2 直接复用，避免重复抓取"""
         recent_seen = self._recent_seen(days=30)
 
         def _dedupe(items: List[dict], apply_recent: bool = True) -> List[dict]:
@@ -755,58 +1123,7 @@ class Curator:
                 output.append(item)
             return output
 
-        source_candidates: dict[str, List[dict]] = {
-            "Product Hunt": [],
-            "Toolify": [],
-            "GitHub": [],
-            "Hacker News": [],
-            "TAAFT": [],
-        }
-        weekly = self.get_weekly_gems()
-        for item in weekly:
-            source = item.get("source") or ""
-            candidate = self._to_candidate_dict(item)
-            if source in source_candidates:
-                source_candidates[source].append(candidate)
-
-        def _pick_one(source: str) -> tuple[Optional[dict], list[dict]]:
-            items = self._prefilter_value(source_candidates.get(source, [])[:])
-            if not items:
-                return None, []
-            try:
-                best = self.llm.select_best(items, source)
-            except Exception:
-                best = None
-            if best and best.get("name"):
-                best_key = (best.get("url") or best.get("name") or "").strip().lower()
-                remaining = [
-                    i
-                    for i in items
-                    if (i.get("url") or i.get("name", "")).strip().lower() != best_key
-                ]
-                return (
-                    {
-                        "name": best.get("name", ""),
-                        "url": best.get("url", ""),
-                        "one_sentence_intro_cn": best.get("one_sentence_intro_cn", ""),
-                        "source": source,
-                    },
-                    remaining,
-                )
-            fallback = items[0]
-            remaining = items[1:]
-            return (
-                {
-                    "name": fallback.get("name", ""),
-                    "url": fallback.get("url", ""),
-                    "one_sentence_intro_cn": self._fallback_reason(
-                        fallback.get("name", ""),
-                        fallback.get("description", ""),
-                    ),
-                    "source": source,
-                },
-                remaining,
-            )
+        weekly = self.get_weekly_gems(exclude=today)
 
         selections: list[dict] = []
 
@@ -816,23 +1133,22 @@ class Curator:
             for item in weekly
         ]
         remaining_pool = self._prefilter_value(remaining_pool)
+        # 同名产品可能同时出现在多个来源（如 PH 发布后又上 TAAFT），只保留一份，省掉重复的 Tavily / LLM 调用
+        remaining_pool = self._dedupe_by_name(remaining_pool)
         
         # 【数据源拼盘】按来源分组，确保多样性
-        source_pools = {
-            "Product Hunt": [],
-            "Toolify": [],
-            "GitHub": [],
-            "Hacker News": [],
-            "TAAFT": [],
-            "Futurepedia": [],
-            "Other": [],
-        }
-        for item in remaining_pool:
-            source = item.get("source", "Other")
-            if source in source_pools:
-                source_pools[source].append(item)
-            else:
-                source_pools["Other"].append(item)
+        # 每个来源一个按热度排序的堆：(-热度, 入池序号, 候选)，序号保证同分时按原顺序且不比较 dict
+        source_pools: defaultdict[str, list[tuple[int, int, dict]]] = defaultdict(list)
+        for order, item in enumerate(remaining_pool):
+            source = item.get("source")
+            heapq.heappush(
+                source_pools[source if source in self._SOURCE_PRIORITY else "Other"],
+                (-item.get("_score", 0), order, item),
+            )
+
+        def _pop_best(source: str) -> Optional[dict]:
+            pool = source_pools[source]
+            return heapq.heappop(pool)[2] if pool else None
         
         # 【强制保送策略 - Force Slot Allocation】
         # 确保来源多样性，防止单一来源霸占
@@ -844,90 +1160,119 @@ class Curator:
         forced_sources = set()  # 记录已强制占位的来源
         
         # 【Slot 1】Product Hunt - 先取一个
-        if source_pools["Product Hunt"]:
-            balanced_candidates.append(source_pools["Product Hunt"][0])
-            forced_sources.add("Product Hunt")
-        
         # 【Slot 2】Toolify - 强制保送（最重要的多样性保证）
-        if source_pools["Toolify"]:
-            balanced_candidates.append(source_pools["Toolify"][0])
-            forced_sources.add("Toolify")
-        
-        # 【Slot 3】TAAFT/Futurepedia - 应用层工具
-        taaft_futurepedia = source_pools["TAAFT"] + source_pools["Futurepedia"]
-        if taaft_futurepedia:
-            balanced_candidates.append(taaft_futurepedia[0])
-            forced_sources.add("TAAFT")
-        
+        # 【Slot 3】TAAFT/Futurepedia - 应用层工具（TAAFT 优先）
         # 【Slot 4】从 Hacker News 补充一个（Show HN 产品发布）
-        if source_pools["Hacker News"]:
-            balanced_candidates.append(source_pools["Hacker News"][0])
-            forced_sources.add("Hacker News")
-        
         # 【Slot 5】从 GitHub 补充一个（有 homepage 的项目）
-        if source_pools["GitHub"]:
-            balanced_candidates.append(source_pools["GitHub"][0])
-            forced_sources.add("GitHub")
+        for slot_sources in (("Product Hunt",), ("Toolify",), ("TAAFT", "Futurepedia"),
+                             ("Hacker News",), ("GitHub",)):
+            for source in slot_sources:
+                item = _pop_best(source)
+                if item is not None:
+                    balanced_candidates.append(item)
+                    forced_sources.add(slot_sources[0])
+                    break
         
-        # 【Slot 6+】轮询补充，确保多样性
+        # 【Slot 6+】轮询补充，确保多样性（已入选的候选已出堆，且候选池已按名称去重）
         source_order = ["TAAFT", "Product Hunt", "Toolify", "Hacker News"]
         for source in source_order:
-            for item in source_pools[source]:
-                if item not in balanced_candidates:
-                    balanced_candidates.append(item)
-                    break  # 每个来源只取一个
+            item = _pop_best(source)
+            if item is not None:
+                balanced_candidates.append(item)  # 每个来源只取一个
             if len(balanced_candidates) >= 8:
                 break
         
         # 只取前 6 个候选（减少 Tavily 调用次数）
         candidates_for_llm = balanced_candidates[:6]
+        # 二次保险：同一链接只补充、只送 LLM 一次
+        seen_urls: set[str] = set()
+        unique_candidates = []
+        for c in candidates_for_llm:
+            url = c.get("url")
+            if url and url in seen_urls:
+                continue
+            seen_urls.add(url)
+            unique_candidates.append(c)
+        candidates_for_llm = unique_candidates
         
+        source_counts = Counter(c.get("source") for c in candidates_for_llm)
         logging.info("Balanced candidates: PH=%d, Toolify=%d, TAAFT=%d, GH/HN=%d",
-                     len([c for c in candidates_for_llm if c.get("source") == "Product Hunt"]),
-                     len([c for c in candidates_for_llm if c.get("source") == "Toolify"]),
-                     len([c for c in candidates_for_llm if c.get("source") == "TAAFT"]),
-                     len([c for c in candidates_for_llm if c.get("source") in ("GitHub", "Hacker News")]))
-        
-        # 【Tavily 深度搜索增强】为候选产品获取详细信息
-        for candidate in candidates_for_llm:
-            name = candidate.get("name", "")
-            if not name:
-                continue
-            # 判断是否为 GitHub 项目
-            is_github = candidate.get("source") == "GitHub"
-            # 获取搜索摘要
-            search_summary = self.enrich_with_search(name, is_github=is_github)
-            if search_summary:
-                # 将搜索结果附加到描述中
-                original_desc = candidate.get("description", "") or candidate.get("tagline", "")
-                candidate["description"] = f"{original_desc} | Tavily: {search_summary}"
+                     source_counts["Product Hunt"],
+                     source_counts["Toolify"],
+                     source_counts["TAAFT"],
+                     source_counts["GitHub"] + source_counts["Hacker News"])
+        
+        # 【Tavily 深度搜索增强】为候选产品获取详细信息（各产品互不依赖，并发请求）
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            # GitHub 项目使用不同的搜索查询，且总要补充（需要查官网信息）；
+            # 其他来源自带描述已足够丰富时只用缓存，不再花一次搜索
+            # 每个任务只改写自己的候选，无需加锁
+            # 每个任务带一个自己的错误列表，失败日志回到当前线程再输出
+            jobs = {}
+            for c in candidates_for_llm:
+                if not c.get("name"):
+                    continue
+                errors: list = []
+                future = executor.submit(
+                    self.enrich_with_search,
+                    c["name"],
+                    c.get("source") == "GitHub",
+                    c.get("source") != "GitHub" and self._has_rich_description(c),
+                    errors,
+                )
+                jobs[future] = (c, errors)
+            for future in as_completed(jobs):
+                candidate, errors = jobs[future]
+                for exc in errors:
+                    logging.warning("Tavily search failed for %s: %s", candidate.get("name"), exc)
+                try:
+                    search_summary = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    # 单个产品失败不影响其他候选
+                    logging.warning("Enrichment failed for %s: %s", candidate.get("name"), exc)
+                    continue
+                if search_summary:
+                    # 将搜索结果附加到描述中
+                    original_desc = candidate.get("description", "") or candidate.get("tagline", "")
+                    candidate["description"] = f"{original_desc} | Tavily: {search_summary}"
+        self._flush_enrich_cache()
+        logging.info("Tavily cache: hits=%d, misses=%d",
+                     self._enrich_stats["hits"], self._enrich_stats["misses"])
         
         # 【核心】让 LLM 选择并翻译
         try:
-            llm_picks = self.llm.select_top_n(candidates_for_llm, min_items=3, max_items=4)
+            # 下划线开头的是内部预计算字段，不发给 LLM
+            llm_input = [
+                {k: v for k, v in c.items() if not k.startswith("_")}
+                for c in candidates_for_llm
+            ]
+            llm_picks = self._select_top_n_cached(llm_input)
         except Exception as e:
             logging.warning("LLM select_top_n failed: %s", e)
             llm_picks = []
         
+        # 产地验证用的名称 -> 描述索引，同名取第一个候选；LLM 很少标 CN，没有 CN 时不必构建
+        name_to_desc: dict[str, str] = {}
+        if any(pick.get("origin") == "CN" for pick in llm_picks):
+            for cand in balanced_candidates:
+                name_to_desc.setdefault(
+                    cand["_name_lc"],
+                    f"{cand.get('tagline', '')} {cand.get('description', '')}".lower(),
+                )
+
         for pick in llm_picks:
             intro = pick.get("one_sentence_intro_cn", "")
             # 后处理：如果 LLM 返回的仍是英文，标记为待翻译
-            if intro and not any('\u4e00' <= c <= '\u9fa5' for c in intro):
+            if intro and _HAN_RE.search(intro) is None:
                 intro = f"(待翻译) {intro[:80]}"
             
             # 【产地验证 - 无罪推定】如果标记为 CN 但没有明确证据，降级为 Global
             origin = pick.get("origin", "Global")
             if origin == "CN":
                 # 在 candidates 中查找对应产品的描述
-                desc = ""
-                for cand in balanced_candidates:
-                    if cand.get("name", "").lower() == pick.get("name", "").lower():
-                        desc = f"{cand.get('tagline', '')} {cand.get('description', '')}".lower()
-                        break
+                desc = name_to_desc.get(pick.get("name", "").lower(), "")
                 # 必须有明确的中国证据
-                cn_evidence = ["北京", "上海", "深圳", "杭州", "中国", "china", "beijing", "shanghai", 
-                               "shenzhen", "hangzhou", "icp", "备案", ".cn", "moonshot", "智谱", "百度"]
-                if not any(ev in desc for ev in cn_evidence):
+                if not self._scan(desc, ("cn_evidence",)):
                     origin = "Global"  # 证据不足，降级为海外
             
             selections.append(
@@ -942,11 +1287,13 @@ class Curator:
         
         # Fallback: 如果 LLM 返回不足 3 个，用原始 tagline
         if len(selections) < 3:
+            selected_names = {s.get("name") for s in selections}
             for item in balanced_candidates:
                 if len(selections) >= 3:
                     break
-                if any(s.get("name") == item.get("name") for s in selections):
+                if item.get("name") in selected_names:
                     continue
+                selected_names.add(item.get("name"))
                 tagline = item.get("tagline", "") or item.get("description", "")
                 selections.append(
                     {
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 from datetime import datetime, time as time_cls, timedelta
-from typing import Optional
+from typing import Optional, Union
 
 import streamlit as st
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 from playwright_stealth import Stealth
 
 from config_manager import load_config, save_config
@@ -13,23 +15,31 @@ from main import run_daily_job
 from notifier import Notifier
 
 
-def _latest_report_path(report_dir: str = "reports") -> Optional[str]:
-    if not os.path.isdir(report_dir):
-        return None
-    files = [
-        os.path.join(report_dir, name)
-        for name in os.listdir(report_dir)
-        if name.endswith("_ai_report.md")
-    ]
-    if not files:
+def _latest_report(report_dir: str = "reports") -> Optional[tuple[str, float]]:
+    """返回最新日报的 (路径, mtime)，没有则返回 None"""
+    # scandir 一次遍历，DirEntry 自带 stat 缓存，每个文件只 stat 一次
+    best, best_mtime = None, -1.0
+    try:
+        with os.scandir(report_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith("_ai_report.md") or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > best_mtime:
+                    best, best_mtime = entry.path, mtime
+    except (FileNotFoundError, NotADirectoryError):
         return None
-    return max(files, key=os.path.getmtime)
+    return (best, best_mtime) if best else None
 
 
-def _load_latest_report(report_dir: str = "reports") -> Optional[str]:
-    path = _latest_report_path(report_dir)
-    if not path:
-        return None
+def _latest_report_path(report_dir: str = "reports") -> Optional[str]:
+    latest = _latest_report(report_dir)
+    return latest[0] if latest else None
+
+
+@st.cache_data(ttl=60)
+def _read_report(path: str, mtime: float) -> Optional[str]:
+    # mtime 只参与缓存键：文件被重写后自动失效
     try:
         with open(path, "r", encoding="utf-8") as f:
             return f.read()
@@ -37,12 +47,113 @@ def _load_latest_report(report_dir: str = "reports") -> Optional[str]:
         return None
 
 
+def _load_latest_report(report_dir: str = "reports") -> Optional[str]:
+    latest = _latest_report(report_dir)
+    if not latest:
+        return None
+    return _read_report(*latest)
+
+
+@st.cache_data(ttl=60)
+def _report_sections(report_md: str) -> list[str]:
+    """按二级标题切分日报，预览时逐段渲染，重跑时未变的段落可被前端复用"""
+    head, *rest = report_md.split("\n## ")
+    return [head] + ["## " + section for section in rest]
+
+
+# 调试截图各站点的「内容已渲染」标志：(选择器, 超时毫秒)
+_READY_SELECTORS = {
+    "toolify": ("div[data-product]", 5000),
+    "ph": ("a[href*='/posts/']", 5000),
+    "aibase": ("main", 5000),
+    "aicpb": ("tbody tr", 15000),
+}
+
+
+_BLOCKED_RESOURCE_TYPES = frozenset({"font", "media"})
+
+
+async def _block_heavy(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _capture_page(context, name: str, url: str, screenshot_dir: str) -> str:
+    page = await context.new_page()
+    try:
+        await Stealth().apply_stealth_async(page)
+        await page.goto(url, wait_until="domcontentloaded")
+        # 等到内容出现即截图；选择器超时再退回等网络空闲，都不行也照常截图
+        selector, timeout = _READY_SELECTORS.get(name, ("body", 5000))
+        try:
+            await page.wait_for_selector(selector, timeout=timeout)
+        except Exception:
+            try:
+                await page.wait_for_load_state("networkidle", timeout=3000)
+            except Exception:
+                pass
+        filename = {
+            "toolify": "debug_toolify.png",
+            "ph": "debug_ph.png",
+            "aibase": "debug_aibase.png",
+            "aicpb": "debug_aicpb.png",
+        }.get(name, f"debug_{name}.png")
+        path = os.path.join(screenshot_dir, filename)
+        await page.screenshot(path=path, full_page=True)
+        return path
+    finally:
+        await page.close()
+
+
+async def _capture_screens(
+    targets: dict[str, str],
+    screenshot_dir: str,
+    auth_state_path: str,
+    auth_profile_dir: str,
+) -> dict[str, Union[str, BaseException]]:
+    """同一个 context 内并发打开所有目标页并截图，总耗时约等于最慢的一页
+
+    返回 {站点: 截图路径或异常}：单个站点超时/出错不影响其余截图
+    """
+    async with async_playwright() as p:
+        if os.path.isdir(auth_profile_dir):
+            context = await p.chromium.launch_persistent_context(
+                auth_profile_dir,
+                headless=True,
+                args=["--disable-blink-features=AutomationControlled"],
+                viewport={"width": 1280, "height": 720},
+            )
+            browser = None
+        else:
+            browser = await p.chromium.launch(headless=True, args=["--disable-blink-features=AutomationControlled"])
+            context = await browser.new_context(
+                viewport={"width": 1280, "height": 720},
+                storage_state=auth_state_path if os.path.exists(auth_state_path) else None,
+            )
+        try:
+            # 截图不需要字体和音视频，直接拦掉；图片和样式保留以便截图反映真实页面
+            await context.route("**/*", _block_heavy)
+            paths = await asyncio.gather(
+                *(_capture_page(context, name, url, screenshot_dir) for name, url in targets.items()),
+                return_exceptions=True,
+            )
+        finally:
+            await context.close()
+            if browser:
+                await browser.close()
+    return dict(zip(targets, paths))
+
+
 st.set_page_config(page_title="AI 情报局 - 指挥中心", layout="wide")
 st.title("AI 情报局 - 指挥中心")
 
 config = load_config()
 if "logs" not in st.session_state:
     st.session_state["logs"] = []
+if "logs_str" not in st.session_state:
+    st.session_state["logs_str"] = "".join(f"{line}\n" for line in st.session_state["logs"])
 if "report_md" not in st.session_state:
     st.session_state["report_md"] = _load_latest_report()
 
@@ -85,18 +196,31 @@ st.subheader("即时运行")
 
 log_expander = st.expander("运行日志", expanded=True)
 log_placeholder = log_expander.empty()
-log_placeholder.code("\n".join(st.session_state["logs"]))
+log_placeholder.code(st.session_state["logs_str"])
+
+# 日志重绘节流间隔（秒）：日志文本增量拼接，重绘按时间合并，避免每条日志都整段重发
+_LOG_FLUSH_INTERVAL = 0.2
+_log_last_flush = 0.0
+
+
+def _flush_logs() -> None:
+    global _log_last_flush
+    log_placeholder.code(st.session_state["logs_str"])
+    _log_last_flush = time.monotonic()
 
 
 def _push_log(message: str) -> None:
     st.session_state["logs"].append(message)
-    log_placeholder.code("\n".join(st.session_state["logs"]))
+    st.session_state["logs_str"] += message + "\n"
+    if time.monotonic() - _log_last_flush >= _LOG_FLUSH_INTERVAL:
+        _flush_logs()
 
 
 col_run, col_send = st.columns([1, 1])
 with col_run:
     if st.button("立即运行"):
         st.session_state["logs"] = []
+        st.session_state["logs_str"] = ""
         log_placeholder.code("")
         try:
             report_md, _ = run_daily_job(
@@ -109,6 +233,8 @@ with col_run:
             st.success("运行完成")
         except Exception as exc:  # noqa: BLE001
             st.error(f"运行失败: {exc}")
+        # 节流期间攒下的最后几行
+        _flush_logs()
 
 with col_send:
     if st.button("Test Send"):
@@ -118,8 +244,8 @@ with col_send:
         elif not config.get("webhook_url"):
             st.warning("请先在侧边栏配置 Webhook。")
         else:
-            notifier = Notifier(webhook_url=config.get("webhook_url"))
-            ok = notifier.send_markdown(report_md)
+            with Notifier(webhook_url=config.get("webhook_url")) as notifier:
+                ok = notifier.send_markdown(report_md)
             if ok:
                 st.success("发送成功")
             else:
@@ -136,54 +262,20 @@ if st.button("📸 运行爬虫并截图"):
     }
     screenshot_dir = "debug_screens"
     os.makedirs(screenshot_dir, exist_ok=True)
-    images = {}
     auth_state_path = os.path.join(os.path.dirname(__file__), "auth_state.json")
     auth_profile_dir = os.path.join(os.path.dirname(__file__), "auth_profile")
-    with sync_playwright() as p:
-        if os.path.isdir(auth_profile_dir):
-            context = p.chromium.launch_persistent_context(
-                auth_profile_dir,
-                headless=True,
-                args=["--disable-blink-features=AutomationControlled"],
-                viewport={"width": 1280, "height": 720},
-            )
-            browser = None
-        else:
-            browser = p.chromium.launch(headless=True, args=["--disable-blink-features=AutomationControlled"])
-            context = browser.new_context(
-                viewport={"width": 1280, "height": 720},
-                storage_state=auth_state_path if os.path.exists(auth_state_path) else None,
-            )
-        for name, url in targets.items():
-            page = context.new_page()
-            Stealth().apply_stealth_sync(page)
-            page.goto(url, wait_until="domcontentloaded")
-            if name == "aicpb":
-                try:
-                    page.wait_for_selector("tbody tr", timeout=15000)
-                except Exception:
-                    page.wait_for_timeout(5000)
-            else:
-                page.wait_for_timeout(5000)
-            filename = {
-                "toolify": "debug_toolify.png",
-                "ph": "debug_ph.png",
-                "aibase": "debug_aibase.png",
-                "aicpb": "debug_aicpb.png",
-            }.get(name, f"debug_{name}.png")
-            path = os.path.join(screenshot_dir, filename)
-            page.screenshot(path=path, full_page=True)
-            images[name] = path
-            page.close()
-        context.close()
-        if browser:
-            browser.close()
+    images = asyncio.run(_capture_screens(targets, screenshot_dir, auth_state_path, auth_profile_dir))
     for name, path in images.items():
-        st.image(path, caption=name, use_container_width=True)
+        if isinstance(path, BaseException):
+            st.warning(f"{name} 截图失败: {path}")
+        else:
+            st.image(path, caption=name, use_container_width=True)
 
 st.markdown("---")
 st.subheader("日报预览")
 if st.session_state.get("report_md"):
-    st.markdown(st.session_state["report_md"], unsafe_allow_html=False)
+    with st.container():
+        for section in _report_sections(st.session_state["report_md"]):
+            st.markdown(section, unsafe_allow_html=False)
 else:
     st.info("暂无日报，请点击“立即运行”。")
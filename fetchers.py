@@ -1,18 +1,166 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+import os
 import re
-from typing import List, Optional
+import tempfile
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
-import feedparser
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, UnicodeDammit
+from bs4.dammit import EncodingDetector
+from lxml import etree
+from lxml.etree import ParserError
+
+try:
+    import ahocorasick
+except ImportError:  # 可选依赖，缺失时退回预编译正则
+    ahocorasick = None
 
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
 )
 
+# 各抓取函数使用的正则，模块加载时编译一次
+_RE_STRIP_TAIL = re.compile(r"\s*Discussion\s*\|\s*Link.*$")
+_RE_PH_TITLE = re.compile(r"\s*-\s*.*?(Discussion|Link).*$")
+_RE_TOOLIFY_URL = re.compile(r"(https?://www\.toolify\.ai/\S+)")
+_RE_TOOLIFY_TOOL = re.compile(r"(https?://www\.toolify\.ai/(?:zh/)?tool/\S+)\s+(\d{4}-\d{2}-\d{2})")
+_RE_HN_PREFIX = re.compile(r'^(Show HN|Launch HN|Ask HN):\s*', re.IGNORECASE)
+_RE_HN_LEADING_PUNCT = re.compile(r'^["\'\-–—]\s*')
+_RE_LEADING_EMOJI = re.compile(r'^[\U0001F300-\U0001F9FF\U00002600-\U000027BF\s]+')
+_RE_BADGE_IMG = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+_RE_BADGE_LINK = re.compile(r'\[[^\]]*\]\([^)]*\)')
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_WS = re.compile(r'\s+')
+
+
+# 模块内所有请求共用的会话：keep-alive 复用 TCP/TLS 连接；连接池容量覆盖 HN item 的并发
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = USER_AGENT
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# 页面级请求的磁盘缓存：15 分钟内直接复用，过期后带 ETag / Last-Modified 做条件请求，304 时沿用缓存正文。
+# 每个 URL 一个 .cache 文件：首行是元数据 JSON（含校验头），其后是正文，二者总是一起替换
+_HTTP_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "http_cache")
+_HTTP_CACHE_FRESH = 15 * 60
+# RSS/Atom 解析器：容错、不解析外部实体
+_FEED_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+
+
+def _cached_response(url: str, meta: dict, body: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = url
+    resp._content = body
+    resp.encoding = meta.get("encoding")
+    resp.headers["Content-Type"] = meta.get("content_type", "")
+    return resp
+
+
+def _read_http_cache(path: str) -> Tuple[Optional[dict], bytes]:
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        head, sep, body = raw.partition(b"\n")
+        if not sep:
+            return None, b""
+        meta = json.loads(head)
+        return (meta, body) if isinstance(meta, dict) else (None, b"")
+    except (OSError, ValueError):
+        return None, b""
+
+
+def _write_http_cache(path: str, meta: dict, body: bytes) -> None:
+    # 每次写入用独立的临时文件再整体替换：多个进程（看板「立即运行」+ 定时任务）同时抓同一 URL 时
+    # 不会写进同一个临时文件，读方也不会拿到新正文配旧 ETag
+    tmp = None
+    try:
+        os.makedirs(_HTTP_CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=_HTTP_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(meta).encode("utf-8"))
+            f.write(b"\n")
+            f.write(body)
+        os.replace(tmp, path)
+        tmp = None
+    except OSError:
+        pass
+    finally:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+def _cached_get(
+    url: str,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    timeout: float = 20,
+) -> requests.Response:
+    """带条件请求缓存的 GET；只缓存 200 响应，缓存读写失败时等同于普通请求"""
+    key = url if not params else f"{url}?{json.dumps(params, sort_keys=True)}"
+    path = os.path.join(_HTTP_CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".cache")
+    meta, body = _read_http_cache(path)
+
+    request_headers = dict(headers or {})
+    if meta:
+        if time.time() - meta.get("ts", 0) < _HTTP_CACHE_FRESH:
+            return _cached_response(url, meta, body)
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = _SESSION.get(url, params=params, headers=request_headers, timeout=timeout)
+    if resp.status_code == 304 and meta:
+        meta["ts"] = time.time()
+        _write_http_cache(path, meta, body)
+        return _cached_response(url, meta, body)
+    if resp.status_code == 200:
+        _write_http_cache(
+            path,
+            {
+                "ts": time.time(),
+                "etag": resp.headers.get("ETag", ""),
+                "last_modified": resp.headers.get("Last-Modified", ""),
+                "encoding": resp.encoding,
+                "content_type": resp.headers.get("Content-Type", ""),
+            },
+            resp.content,
+        )
+    return resp
+
+
+def _iter_pages_concurrently(
+    urls: List[str], headers: Optional[dict] = None, timeout: float = 20
+) -> Iterator[Optional[requests.Response]]:
+    """同时请求一组备选页面，按 urls 顺序产出响应（请求异常时为 None）；调用方停止迭代后不再等待其余请求"""
+    pool = ThreadPoolExecutor(max_workers=max(len(urls), 1))
+
+    def _get(url: str) -> Optional[requests.Response]:
+        try:
+            return _cached_get(url, headers=headers, timeout=timeout)
+        except Exception:
+            return None
+
+    try:
+        yield from pool.map(_get, urls)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 
 def _to_datetime(value: str) -> Optional[datetime]:
     if not value:
@@ -23,41 +171,106 @@ def _to_datetime(value: str) -> Optional[datetime]:
         return None
 
 
+@lru_cache(maxsize=4096)
 def _strip_html(text: str) -> str:
     if not text:
         return ""
-    soup = BeautifulSoup(text, "html.parser")
+    soup = BeautifulSoup(text, "lxml")
     cleaned = soup.get_text(" ", strip=True)
-    cleaned = re.sub(r"\s*Discussion\s*\|\s*Link.*$", "", cleaned).strip()
+    cleaned = _RE_STRIP_TAIL.sub("", cleaned).strip()
     return cleaned
 
 
+def _select_links(content: bytes, href_part: str) -> List[tuple[str, str]]:
+    """返回页面中 href 含 href_part 的链接 (href, 文本)
+
+    列表页只需要跑一个选择器，直接用 lxml 的 XPath，不再构建 BeautifulSoup 的 Python DOM；
+    文本拼接方式与 get_text(strip=True) 一致。
+    """
+    if not content:
+        return []
+    try:
+        # 页面声明了编码（绝大多数情况）时直接把字节交给 libxml2 边解码边解析，省掉整页 str 副本
+        declared = EncodingDetector.find_declared_encoding(content, is_html=True)
+        if declared:
+            try:
+                tree = lxml.html.document_fromstring(content, parser=lxml.html.HTMLParser(encoding=declared))
+            except LookupError:  # 声明了 libxml2 不认识的编码
+                declared = None
+        if not declared:
+            # 与 BeautifulSoup 相同的编码探测（BOM / 猜测），lxml 对无声明的字节会按 latin-1 解码
+            markup = UnicodeDammit(content, is_html=True).unicode_markup
+            if not markup:
+                return []
+            tree = lxml.html.document_fromstring(markup)
+    except (ParserError, ValueError):
+        return []
+    return [
+        (link.get("href", ""), "".join(part.strip() for part in link.itertext()))
+        for link in tree.xpath("//a[contains(@href, $part)]", part=href_part)
+    ]
+
+
+@lru_cache(maxsize=4096)
 def _clean_ph_title(title: str) -> str:
     if not title:
         return ""
-    return re.sub(r"\s*-\s*.*?(Discussion|Link).*$", "", title).strip()
+    return _RE_PH_TITLE.sub("", title).strip()
 
 
-def _parse_rss_datetime(entry) -> Optional[datetime]:
-    if entry.get("published_parsed"):
+def _parse_rss_datetime(value: str) -> Optional[datetime]:
+    """解析 RSS pubDate（RFC 822）或 Atom published/updated（ISO 8601），统一为 UTC"""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
         try:
-            return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-        except Exception:
-            return None
-    return _to_datetime(entry.get("published", ""))
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return _to_datetime(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _feed_entry_link(entry) -> str:
+    # RSS 的 <link> 是文本；Atom 的是 href 属性，优先 rel="alternate"
+    links = entry.findall("{*}link")
+    for link in links:
+        if link.get("href") and link.get("rel", "alternate") == "alternate":
+            return link.get("href")
+    for link in links:
+        if link.text:
+            return link.text
+    return links[0].get("href", "") if links else ""
 
 
 def fetch_product_hunt_rss(limit: int = 30) -> List[dict]:
-    feed = feedparser.parse("https://www.producthunt.com/feed")
+    try:
+        resp = _cached_get("https://www.producthunt.com/feed", timeout=20)
+        resp.raise_for_status()
+        # 只读几个字段，直接用 lxml 解析 XML，不走 feedparser 的整套清洗流程；兼容 RSS 2.0 与 Atom
+        root = etree.fromstring(resp.content, parser=_FEED_PARSER)
+    except Exception:
+        return []
+    if root is None:
+        return []
     items: List[dict] = []
-    for entry in feed.entries[:limit]:
-        raw_title = (entry.get("title") or "").strip()
+    for entry in list(root.iter("{*}item", "{*}entry"))[:limit]:
+        raw_title = (entry.findtext("{*}title") or "").strip()
         name = _clean_ph_title(raw_title)
-        link = (entry.get("link") or "").strip()
+        link = _feed_entry_link(entry).strip()
         if not name or not link:
             continue
-        published_at = _parse_rss_datetime(entry)
-        tagline = _strip_html(entry.get("summary") or "").strip()
+        published_at = _parse_rss_datetime(
+            entry.findtext("{*}pubDate") or entry.findtext("{*}published") or entry.findtext("{*}updated") or ""
+        )
+        summary = (
+            entry.findtext("{*}description") or entry.findtext("{*}summary") or entry.findtext("{*}content") or ""
+        )
+        tagline = _strip_html(summary).strip()
         items.append(
             {
                 "name": name,
@@ -77,15 +290,12 @@ def _extract_toolify_jina(text: str, kind: str) -> List[tuple[str, str]]:
     if kind == "sitemap":
         return [
             (match.group(1), "")
-            for match in re.finditer(r"(https?://www\.toolify\.ai/\S+)", content)
+            for match in _RE_TOOLIFY_URL.finditer(content)
             if "sitemap_tools" in match.group(1)
         ]
     return [
         (match.group(1), match.group(2))
-        for match in re.finditer(
-            r"(https?://www\.toolify\.ai/(?:zh/)?tool/\S+)\s+(\d{4}-\d{2}-\d{2})",
-            content,
-        )
+        for match in _RE_TOOLIFY_TOOL.finditer(content)
     ]
 
 
@@ -109,18 +319,17 @@ def _fetch_toolify_html(limit: int = 50) -> List[dict]:
     ]
     seen_urls = set()
     seen_names = set()
-    for page_url in urls_to_try:
+    # 列表页没有发布时间，统一记为本次抓取时间
+    fetched_at = datetime.now(timezone.utc)
+    # 两个页面同时请求，仍按顺序优先使用前一个有结果的页面
+    for resp in _iter_pages_concurrently(urls_to_try, headers=headers, timeout=25):
         try:
-            resp = requests.get(page_url, headers=headers, timeout=25)
-            if resp.status_code >= 400:
+            if resp is None or resp.status_code >= 400:
                 continue
-            soup = BeautifulSoup(resp.text, "html.parser")
             # 寻找工具卡片链接
-            for link in soup.select('a[href*="/tool/"]'):
+            for href, name in _select_links(resp.content, "/tool/"):
                 if len(items) >= limit:
                     break
-                href = link.get("href", "")
-                name = link.get_text(strip=True)
                 if not name or len(name) < 2 or not href:
                     continue
                 # 规范化 URL
@@ -137,7 +346,7 @@ def _fetch_toolify_html(limit: int = 50) -> List[dict]:
                     "name": name,
                     "url": url_key,
                     "tagline": "",
-                    "published_at": datetime.now(timezone.utc),
+                    "published_at": fetched_at,
                     "source": "Toolify",
                 })
             if items:
@@ -156,11 +365,9 @@ def _fetch_toolify_sitemap_jina(limit: int = 50) -> List[dict]:
         ("https://www.toolify.ai/sitemap_tools_3.xml", ""),
         ("https://www.toolify.ai/sitemap_tools_4.xml", ""),
     ]
-    for link, _ in sitemap_urls[:4]:
+    jina_urls = [f"https://r.jina.ai/http://{link.replace('https://', '')}" for link, _ in sitemap_urls[:4]]
+    for idx in _iter_pages_concurrently(jina_urls, timeout=25):
         try:
-            idx = requests.get(
-                f"https://r.jina.ai/http://{link.replace('https://', '')}", timeout=25
-            )
             idx.raise_for_status()
         except Exception:
             continue
@@ -186,60 +393,122 @@ def _fetch_toolify_sitemap_jina(limit: int = 50) -> List[dict]:
     return items
 
 
-def fetch_hacker_news_ai(limit: int = 40) -> List[dict]:
-    """只抓取 Show HN 中的 AI 工具发布，过滤掉新闻/故事/非AI内容"""
-    # 【叙事性标题黑名单】这些是故事/新闻，不是产品发布
-    HN_STORY_BLOCKLIST = {
-        "firmware", "intelligence", "security", "police", "hack", "hacked", "hacking",
-        "story", "how i", "why i", "what i", "my experience", "lessons learned",
-        "detained", "arrested", "incident", "breach", "leak", "vulnerability",
-        "exploit", "reverse engineer", "investigation", "research paper",
-        "lighthouse", "navigation", "swiss", "government", "politics",
-    }
-    # 【AI 关键词白名单】标题必须包含这些 AI 相关词才算
-    AI_KEYWORDS = {"ai", "gpt", "llm", "ml", "machine learning", "chatbot", "neural", "openai", "claude", "gemini"}
-    # 【产品发布白名单】优先保留这些标题模式
-    HN_LAUNCH_WHITELIST = {"show hn", "launch", "release", "introducing", "announcing"}
-    
-    items: List[dict] = []
+# 【AI 关键词白名单】HN 标题必须包含这些 AI 相关词（独立单词）才算，合成一个正则一次扫描
+HN_AI_KEYWORDS = ("ai", "gpt", "llm", "ml", "machine learning", "chatbot", "neural", "openai", "claude", "gemini")
+_RE_HN_AI_KEYWORD = re.compile(r"\b(?:" + "|".join(map(re.escape, HN_AI_KEYWORDS)) + r")\b")
+
+# 【叙事性标题黑名单】这些是故事/新闻，不是产品发布（子串匹配）
+HN_STORY_BLOCKLIST = {
+    "firmware", "intelligence", "security", "police", "hack", "hacked", "hacking",
+    "story", "how i", "why i", "what i", "my experience", "lessons learned",
+    "detained", "arrested", "incident", "breach", "leak", "vulnerability",
+    "exploit", "reverse engineer", "investigation", "research paper",
+    "lighthouse", "navigation", "swiss", "government", "politics",
+}
+_RE_HN_STORY_BLOCK = re.compile("|".join(map(re.escape, HN_STORY_BLOCKLIST)))
+# 【产品发布白名单】优先保留这些标题模式（子串匹配）
+HN_LAUNCH_WHITELIST = {"show hn", "launch", "release", "introducing", "announcing"}
+_RE_HN_LAUNCH = re.compile("|".join(map(re.escape, HN_LAUNCH_WHITELIST)))
+
+# Hacker News 逐条拉取 item 的并发数，以及同时在途的请求上限
+_HN_ITEM_WORKERS = 16
+_HN_ITEM_PREFETCH = 32
+
+
+def _fetch_hn_item(story_id: int) -> Optional[dict]:
+    try:
+        return _SESSION.get(
+            f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json", timeout=15
+        ).json()
+    except Exception:
+        return None
+
+
+def _fetch_hn_show_algolia() -> List[tuple[str, dict]]:
+    """一次请求拿到最新 200 条 Show HN，整理成与 firebase item 相同的字段；失败返回空列表"""
+    try:
+        resp = _cached_get(
+            "https://hn.algolia.com/api/v1/search_by_date",
+            params={"tags": "show_hn", "hitsPerPage": 200},
+            timeout=15,
+        )
+        resp.raise_for_status()
+        hits = resp.json().get("hits") or []
+    except Exception:
+        return []
+    return [
+        (
+            hit.get("objectID", ""),
+            {"title": hit.get("title"), "url": hit.get("url"), "time": hit.get("created_at_i") or 0},
+        )
+        for hit in hits
+    ]
+
+
+def _iter_hn_show_stories() -> Iterator[tuple[str, dict]]:
+    """按顺序产出 (story_id, item)：优先 Algolia 单次批量接口，失败时退回 firebase 逐条拉取"""
+    stories = _fetch_hn_show_algolia()
+    if stories:
+        yield from stories
+        return
     try:
-        ids = requests.get(
+        ids = _cached_get(
             "https://hacker-news.firebaseio.com/v0/showstories.json", timeout=15
         ).json()
     except Exception:
-        return items
-    for story_id in ids[:200]:
-        try:
-            data = requests.get(
-                f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json", timeout=15
-            ).json()
-        except Exception:
-            continue
+        return
+    # item 请求并发发出并共享连接池，结果按原顺序消费；只保持 _HN_ITEM_PREFETCH 个请求在途，
+    # 调用方凑够数量提前停止时，后面的 id 不会再发请求
+    pool = ThreadPoolExecutor(max_workers=_HN_ITEM_WORKERS)
+    pending: deque[tuple[int, Future]] = deque()
+    remaining = iter(ids)
+
+    def _refill() -> None:
+        while len(pending) < _HN_ITEM_PREFETCH:
+            story_id = next(remaining, None)
+            if story_id is None:
+                return
+            pending.append((story_id, pool.submit(_fetch_hn_item, story_id)))
+
+    try:
+        _refill()
+        while pending:
+            story_id, future = pending.popleft()
+            _refill()
+            data = future.result()
+            if data:
+                yield story_id, data
+    finally:
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+def fetch_hacker_news_ai(limit: int = 40) -> List[dict]:
+    """只抓取 Show HN 中的 AI 工具发布，过滤掉新闻/故事/非AI内容"""
+    items: List[dict] = []
+    for story_id, data in _iter_hn_show_stories():
         title = (data.get("title") or "").strip()
         title_lower = title.lower()
         
         # 必须包含 AI 相关词（作为独立单词，避免误匹配如 "aids"）
-        has_ai = any(
-            re.search(rf'\b{kw}\b', title_lower) 
-            for kw in AI_KEYWORDS
-        )
-        if not has_ai:
+        if not _RE_HN_AI_KEYWORD.search(title_lower):
             continue
         
         # 【去新闻化过滤】叙事性标题直接丢弃
-        if any(block in title_lower for block in HN_STORY_BLOCKLIST):
+        if _RE_HN_STORY_BLOCK.search(title_lower):
             continue
         
         # 优先保留明确的产品发布
-        is_launch = any(launch in title_lower for launch in HN_LAUNCH_WHITELIST)
+        is_launch = _RE_HN_LAUNCH.search(title_lower) is not None
         
         url = data.get("url") or f"https://news.ycombinator.com/item?id={story_id}"
         published_at = datetime.fromtimestamp(data.get("time", 0), tz=timezone.utc)
         
         # 【清洗标题】移除 Show HN / Launch HN / Ask HN 前缀
-        clean_title = re.sub(r'^(Show HN|Launch HN|Ask HN):\s*', '', title, flags=re.IGNORECASE)
+        clean_title = _RE_HN_PREFIX.sub('', title)
         # 移除多余的引号和破折号
-        clean_title = re.sub(r'^["\'\-–—]\s*', '', clean_title).strip()
+        clean_title = _RE_HN_LEADING_PUNCT.sub('', clean_title).strip()
         
         items.append(
             {
@@ -256,6 +525,22 @@ def fetch_hacker_news_ai(limit: int = 40) -> List[dict]:
     return items
 
 
+def _build_contains_any(keywords: Iterable[str]) -> Callable[[str], bool]:
+    """构建「文本是否包含任一关键词（子串）」的判断函数，一次扫描完成
+
+    优先用 Aho-Corasick 自动机，未安装 pyahocorasick 时退回单个预编译的正则交替式。
+    """
+    keywords = tuple(keywords)
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    pattern = re.compile("|".join(map(re.escape, keywords)))
+    return lambda text: pattern.search(text) is not None
+
+
 # 负向关键词：过滤教程、课程、资源合集等非工具类项目
 GITHUB_BLOCKLIST = {
     "tutorial", "tutorials", "course", "courses", "bootcamp", "bootcamps",
@@ -266,14 +551,15 @@ GITHUB_BLOCKLIST = {
     "interview", "interviews", "exercises", "practice", "training",
     "workshop", "workshops", "resources", "教程", "课程", "学习",
 }
+_has_courseware_keyword = _build_contains_any(GITHUB_BLOCKLIST)
 
 
+@lru_cache(maxsize=4096)
 def _is_github_courseware(name: str, description: str) -> bool:
     """检查是否为教程/课程/资源合集类项目（非工具）"""
     haystack = f"{name} {description}".lower()
-    for keyword in GITHUB_BLOCKLIST:
-        if keyword in haystack:
-            return True
+    if _has_courseware_keyword(haystack):
+        return True
     # 额外检查：awesome-* 前缀
     if name.lower().startswith("awesome-"):
         return True
@@ -290,46 +576,54 @@ GITHUB_DEV_BLOCKLIST = {
     "package", "module", "component", "plugin", "extension",
     "binding", "wrapper", "integration", "middleware",
 }
+_has_dev_keyword = _build_contains_any(GITHUB_DEV_BLOCKLIST)
+# GUI/App/Desktop 及 no-code/low-code 相关词
+_has_gui_indicator = _build_contains_any(
+    ("app", "desktop", "gui", "web app", "webapp", "saas", "no-code", "nocode", "low-code", "lowcode")
+)
+# Python/JS/Rust 等语言的库
+_has_lib_pattern = _build_contains_any(
+    ("python", "node", "npm", "rust", "go ", "golang", "java ", "ruby", "php")
+)
 
 
-def _is_github_dev_tool(name: str, description: str, topics: list) -> bool:
-    """检查是否为开发者工具/代码库（普通用户无法直接使用）"""
+@lru_cache(maxsize=4096)
+def _is_github_dev_tool(name: str, description: str, topics: tuple) -> bool:
+    """检查是否为开发者工具/代码库（普通用户无法直接使用）；topics 传 tuple 以便缓存"""
     haystack = f"{name} {description}".lower()
     topics_str = " ".join(topics).lower() if topics else ""
     
     # 检查开发者工具关键词
-    for keyword in GITHUB_DEV_BLOCKLIST:
-        if keyword in haystack or keyword in topics_str:
-            return True
+    if _has_dev_keyword(haystack) or _has_dev_keyword(topics_str):
+        return True
     
     # 如果没有 GUI/App/Desktop 相关词，且没有 no-code/low-code，可能是代码库
-    gui_indicators = {"app", "desktop", "gui", "web app", "webapp", "saas", "no-code", "nocode", "low-code", "lowcode"}
-    has_gui = any(ind in haystack or ind in topics_str for ind in gui_indicators)
+    has_gui = _has_gui_indicator(haystack) or _has_gui_indicator(topics_str)
     
     # 如果明确是 Python/JS/Rust 等语言的库，剔除
-    lib_patterns = ["python", "node", "npm", "rust", "go ", "golang", "java ", "ruby", "php"]
-    is_lib = any(p in haystack for p in lib_patterns) and not has_gui
+    is_lib = _has_lib_pattern(haystack) and not has_gui
     
     return is_lib
 
 
+@lru_cache(maxsize=4096)
 def _clean_github_description(desc: str) -> str:
     """清理 GitHub 描述，移除徽章、emoji 和无用前缀"""
     if not desc:
         return ""
     cleaned = desc
     # 移除开头的 emoji
-    cleaned = re.sub(r'^[\U0001F300-\U0001F9FF\U00002600-\U000027BF\s]+', '', cleaned)
-    # 移除 [badge] 或 ![badge](url) 格式
-    cleaned = re.sub(r'!\[[^\]]*\]\([^)]*\)', '', cleaned)
-    cleaned = re.sub(r'\[[^\]]*\]\([^)]*\)', '', cleaned)
+    cleaned = _RE_LEADING_EMOJI.sub('', cleaned)
+    # 移除 [badge] 或 ![badge](url) 格式；绝大多数描述是纯文本，没有 "](" / "<" 时跳过这几遍扫描
+    # （不合并成一个交替式：嵌套徽章 [![b](img)](url) 需要先去图片再去链接）
+    if "](" in cleaned:
+        cleaned = _RE_BADGE_IMG.sub('', cleaned)
+        cleaned = _RE_BADGE_LINK.sub('', cleaned)
     # 移除 HTML 标签
-    cleaned = re.sub(r'<[^>]+>', '', cleaned)
-    # 移除多余空白
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-    # 移除开头的冒号（常见于 emoji 后）
-    cleaned = re.sub(r'^[:\s]+', '', cleaned)
-    return cleaned
+    if "<" in cleaned:
+        cleaned = _RE_HTML_TAG.sub('', cleaned)
+    # 移除多余空白，以及开头的冒号（常见于 emoji 后）；空白已折叠为单个空格
+    return _RE_WS.sub(' ', cleaned).strip().lstrip(': ')
 
 
 def fetch_github_ai(limit: int = 40) -> List[dict]:
@@ -355,10 +649,12 @@ def fetch_github_ai(limit: int = 40) -> List[dict]:
     for query in queries:
         url = f"https://api.github.com/search/repositories?q={query}&sort=stars&order=desc&per_page=20"
         try:
-            resp = requests.get(url, headers=headers, timeout=30)
+            resp = _cached_get(url, headers=headers, timeout=30)
             if resp.status_code == 200:
                 data = resp.json()
-                break
+                # 命中即停；结果为空时才换下一个查询，避免白白放弃后面的备选
+                if data.get("items"):
+                    break
         except Exception:
             continue
     if not data.get("items"):
@@ -375,7 +671,7 @@ def fetch_github_ai(limit: int = 40) -> List[dict]:
         if _is_github_courseware(name, raw_desc):
             continue
         # 过滤开发者工具/代码库（非应用）
-        if _is_github_dev_tool(name, raw_desc, topics):
+        if _is_github_dev_tool(name, raw_desc, tuple(topics)):
             continue
         # 清理描述，移除徽章和 emoji
         desc = _clean_github_description(raw_desc)
@@ -400,6 +696,11 @@ def fetch_github_ai(limit: int = 40) -> List[dict]:
     return items
 
 
+# TAAFT 链接文本的无效名称：价格字符串、版本号（子串匹配）；月份缩写需与数字同时出现才视为日期
+_RE_TAAFT_REJECT = re.compile(r"free|pricing|from \$|/mo|/yr|\$ |·|v[012]")
+_RE_TAAFT_MONTH = re.compile(r"jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec")
+
+
 def fetch_taaft_timeline(limit: int = 40) -> List[dict]:
     """抓取 TAAFT 新工具列表（应用层 AI 工具）"""
     items: List[dict] = []
@@ -407,46 +708,38 @@ def fetch_taaft_timeline(limit: int = 40) -> List[dict]:
     # 使用 /new/ 页面，数据更稳定
     url = "https://theresanaiforthat.com/new/"
     try:
-        resp = requests.get(url, headers=headers, timeout=20)
+        resp = _cached_get(url, headers=headers, timeout=20)
         resp.raise_for_status()
     except Exception:
         return items
-    soup = BeautifulSoup(resp.text, "html.parser")
-    
     # 找所有 /ai/tool-name/ 链接
     seen_tools = set()
-    links = soup.select('a[href*="/ai/"]')
-    for link in links:
+    fetched_at = datetime.now(timezone.utc)
+    links = _select_links(resp.content, "/ai/")
+    for href, name in links:
         if len(items) >= limit:
             break
-        href = link.get("href", "")
         # 过滤：只要 /ai/xxx/ 格式，排除广告链接(ref=sponsor)
         if not href or "/ai/" not in href:
             continue
         if "ref=sponsor" in href or "ref=taaft" in href:
             continue
-        # 提取工具名
-        name = link.get_text(strip=True)
         # 过滤掉价格、数字、日期等无效名称
         if not name or len(name) < 2:
             continue
         name_lower = name.lower()
-        # 过滤价格字符串
-        if any(p in name_lower for p in ["free", "pricing", "from $", "/mo", "/yr", "$ ", "·"]):
+        # 过滤价格字符串、版本号 (v1.1.0)，一个正则一次扫描
+        if _RE_TAAFT_REJECT.search(name_lower):
             continue
         # 过滤日期和 @ 开头的 Twitter handles
-        if name.startswith("@") or name.startswith("#"):
+        if name.startswith(("@", "#")):
             continue
         # 过滤日期格式 (Oct 30, 2025)
-        months = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
-        if any(m in name_lower for m in months) and any(c.isdigit() for c in name):
+        if _RE_TAAFT_MONTH.search(name_lower) and any(c.isdigit() for c in name):
             continue
         # 过滤纯数字或以数字开头的
         if any(c.isdigit() for c in name[:3]):
             continue
-        # 过滤版本号 (v1.1.0)
-        if "v1" in name_lower or "v2" in name_lower or "v0" in name_lower:
-            continue
         # 规范化 URL
         if href.startswith("/"):
             href = f"https://theresanaiforthat.com{href}"
@@ -461,7 +754,7 @@ def fetch_taaft_timeline(limit: int = 40) -> List[dict]:
                 "name": name,
                 "url": href.split("?")[0],  # 移除查询参数
                 "tagline": "",
-                "published_at": datetime.now(timezone.utc),
+                "published_at": fetched_at,
                 "source": "TAAFT",
             }
         )
@@ -478,12 +771,10 @@ def fetch_futurepedia(limit: int = 30) -> List[dict]:
     headers = {"User-Agent": USER_AGENT}
     url = "https://www.futurepedia.io/"
     try:
-        resp = requests.get(url, headers=headers, timeout=20)
+        resp = _cached_get(url, headers=headers, timeout=20)
         resp.raise_for_status()
     except Exception:
         return items
-    soup = BeautifulSoup(resp.text, "html.parser")
-    
     # 大厂黑名单（这些会被 Curator 过滤，但在这里提前过滤能提高效率）
     giant_blocklist = {
         "chatgpt", "claude", "midjourney", "perplexity", "gemini", "grok", "copilot",
@@ -492,12 +783,11 @@ def fetch_futurepedia(limit: int = 30) -> List[dict]:
     }
     
     seen = set()
-    tool_links = soup.select('a[href*="/tool/"]')
-    for link in tool_links:
+    fetched_at = datetime.now(timezone.utc)
+    tool_links = _select_links(resp.content, "/tool/")
+    for href, name in tool_links:
         if len(items) >= limit:
             break
-        href = link.get("href", "")
-        name = link.get_text(strip=True)
         if not name or len(name) < 2:
             continue
         # 过滤大厂
@@ -514,7 +804,7 @@ def fetch_futurepedia(limit: int = 30) -> List[dict]:
                 "name": name,
                 "url": href if href.startswith("http") else f"https://www.futurepedia.io{href}",
                 "tagline": "",
-                "published_at": datetime.now(timezone.utc),
+                "published_at": fetched_at,
                 "source": "Futurepedia",
             }
         )
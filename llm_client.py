@@ -5,9 +5,98 @@ import logging
 import random
 import re
 import time
-from typing import List, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+# 文本检测 / 响应解析使用的正则，模块加载时编译一次
+_RE_CJK = re.compile(r'[\u4e00-\u9fa5]')
+_RE_PUNCT_WS = re.compile(r'[\s\.,!?;:\-\"\'\(\)\[\]{}]')
+_RE_THINK = re.compile(r"<think>.*?</think>", re.DOTALL)
+_RE_JSON_FENCE = re.compile(r"```json\s*")
+_RE_FENCE = re.compile(r"```\s*")
+
+# _needs_rewrite 的检测词（小写子串匹配），合成一个交替式一次扫描
+# 垃圾通用词
+_GARBAGE_PHRASES = ("text to video generator", "ai writer free")
+# 元数据噪音
+_METADATA_NOISE = (
+    "1 day ago", "2 days ago", "3 days ago", "days ago", "hours ago",
+    "source:", "updated:", "stars", "⭐", "created:", "discussion",
+    "comments", "| link", "read more", "click here",
+)
+_RE_REWRITE_NOISE = re.compile("|".join(map(re.escape, _GARBAGE_PHRASES + _METADATA_NOISE)))
+
+# select_best 发给 LLM 的候选字段；简介类长文本截断（名称、链接需原样回传，不截）
+_TRIM_FIELDS = ("name", "url", "tagline", "description")
+_TRIM_TEXT_FIELDS = ("tagline", "description")
+_TRIM_FIELD_CHARS = 200
+
+
+def _json_dumps(data) -> str:
+    """紧凑序列化（保留中文原文），orjson 可用时走 orjson"""
+    if orjson:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_loads(raw):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+_JSON_CLOSERS = {"}": "{", "]": "["}
+_JSON_DECODER = json.JSONDecoder()
+_JSON_FALLBACK_TRIES = 32
+_JSON_PARSE_BUDGET = 8
+
+
+def _is_dict(value) -> bool:
+    return isinstance(value, dict)
+
+
+def _is_dict_list(value) -> bool:
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+def _json_spans(text: str) -> Tuple[List[Tuple[int, int]], List[int]]:
+    """单次线性扫描找出所有配对的 {...} / [...] 区间（按起点排序），以及落在字符串里的括号位置
+
+    跟踪引号与转义状态，字符串里的括号不计入；类型不匹配的闭括号直接忽略。
+    替代原先的回溯正则，畸形长输出下也不会退化。
+    """
+    spans = []
+    stack = []
+    in_string = escape = False
+    in_string_openers = []
+    for i, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            elif ch == "{" or ch == "[":
+                in_string_openers.append(i)
+        elif ch == "{" or ch == "[":
+            stack.append((ch, i))
+        elif ch == "}" or ch == "]":
+            if stack and stack[-1][0] == _JSON_CLOSERS[ch]:
+                spans.append((stack.pop()[1], i + 1))
+        elif ch == '"' and stack:
+            # 只在括号内部跟踪字符串，正文里的引号不影响配对
+            in_string = True
+    # 引号到结尾都没闭合也不回头重扫：被“吞”进字符串的括号已记入 in_string_openers，交给调用方兜底
+    spans.sort()
+    return spans, in_string_openers
 
 
 SYSTEM_PROMPT = '''你是一名正在做竞品分析的**工具类产品经理**。
@@ -105,22 +194,35 @@ class LLMClient:
         self.temperature = temperature
         self.timeout = timeout
         self.max_retries = max_retries
+        # 复用到 LLM 接口的 keep-alive 连接，逐条调用时省掉每次的 TCP/TLS 握手
+        self._session = requests.Session()
+        self._session.mount(self.base_url, HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._session.close()
 
     @staticmethod
     def _contains_chinese(text: str) -> bool:
         """检查文本是否包含中文字符"""
         if not text:
             return False
-        return bool(re.search(r'[\u4e00-\u9fa5]', text))
+        return bool(_RE_CJK.search(text))
 
     @staticmethod
     def _chinese_ratio(text: str) -> float:
         """计算中文字符占比"""
         if not text:
             return 0.0
-        chinese_chars = len(re.findall(r'[\u4e00-\u9fa5]', text))
+        # subn 只计数，不构建匹配列表 / 去标点后的新字符串
+        chinese_chars = _RE_CJK.subn('', text)[1]
         # 只计算非空白、非标点的有效字符
-        effective_chars = len(re.sub(r'[\s\.,!?;:\-\"\'\(\)\[\]{}]', '', text))
+        effective_chars = len(text) - _RE_PUNCT_WS.subn('', text)[1]
         if effective_chars == 0:
             return 0.0
         return chinese_chars / effective_chars
@@ -129,34 +231,22 @@ class LLMClient:
     def _needs_rewrite(text: str) -> bool:
         if not text:
             return True
-        lowered = text.lower()
-        # 垃圾通用词检测
-        garbage_phrases = ["text to video generator", "ai writer free"]
-        if any(p in lowered for p in garbage_phrases):
-            return True
-        # 元数据噪音检测
-        metadata_noise = [
-            "1 day ago", "2 days ago", "3 days ago", "days ago", "hours ago",
-            "source:", "updated:", "stars", "⭐", "created:", "discussion",
-            "comments", "| link", "read more", "click here",
-        ]
-        if any(noise in lowered for noise in metadata_noise):
-            return True
-        # 中文占比检测：如果中文字符占比低于 40%，说明没有正确翻译
-        if not LLMClient._contains_chinese(text):
+        # 垃圾通用词 / 元数据噪音检测
+        if _RE_REWRITE_NOISE.search(text.lower()):
             return True
-        if LLMClient._chinese_ratio(text) < 0.4:
-            return True
-        return False
+        # 中文占比检测：如果中文字符占比低于 40%，说明没有正确翻译（不含中文时占比为 0）
+        return LLMClient._chinese_ratio(text) < 0.4
 
     @staticmethod
     def _postprocess_intro(text: str) -> str:
         """后处理：如果检测到翻译失败，添加前缀标记"""
         if not text:
             return "(自动翻译失败) 暂无中文介绍"
-        if not LLMClient._contains_chinese(text):
+        # 占比为 0 当且仅当不含中文，一次计算同时完成两项判断
+        ratio = LLMClient._chinese_ratio(text)
+        if ratio == 0:
             return f"(自动翻译失败) {text}"
-        if LLMClient._chinese_ratio(text) < 0.3:
+        if ratio < 0.3:
             return f"(翻译不完整) {text}"
         return text
 
@@ -164,7 +254,8 @@ class LLMClient:
     def _is_invalid_output(text: str) -> bool:
         if not text:
             return True
-        return "error: 无效数据" in text.lower()
+        # "无效数据" 不受大小写影响，先做一次廉价子串判断，绝大多数正常输出不必再 lower()
+        return "无效数据" in text and "error: 无效数据" in text.lower()
 
     def _request(self, messages: List[dict]) -> str:
         url = f"{self.base_url}/chat/completions"
@@ -173,64 +264,124 @@ class LLMClient:
             "Authorization": f"Bearer {self.api_key}",
         }
         payload = {"model": self.model, "messages": messages, "temperature": self.temperature}
+        body = _json_dumps(payload).encode("utf-8")
         last_err = None
         for attempt in range(1, self.max_retries + 1):
+            is_last = attempt == self.max_retries
             try:
-                resp = requests.post(url, headers=headers, json=payload, timeout=self.timeout)
-                # 检查 429 Rate Limit
+                resp = self._session.post(url, headers=headers, data=body, timeout=self.timeout)
+                # 检查 429 Rate Limit：优先按服务端 Retry-After 等待，没有时退回递增等待
                 if resp.status_code == 429:
-                    wait_time = min(30 * attempt, 120)  # 更长的等待时间
+                    last_err = requests.HTTPError("429 Too Many Requests", response=resp)
+                    if is_last:
+                        break
+                    retry_after = self._retry_after_seconds(resp)
+                    wait_time = retry_after if retry_after is not None else min(30 * attempt, 120)
                     logging.warning("Rate limited (429), waiting %ds...", wait_time)
                     time.sleep(wait_time)
                     continue
                 resp.raise_for_status()
-                data = resp.json()
+                data = _json_loads(resp.content)
+                self._log_cache_usage(data.get("usage"))
                 return data["choices"][0]["message"]["content"].strip()
             except Exception as exc:  # noqa: BLE001
                 last_err = exc
                 logging.debug("LLM request attempt %d failed: %s", attempt, exc)
-                time.sleep(min(2**attempt, 10) + random.random())
+                # 最后一次失败后不再白等
+                if not is_last:
+                    time.sleep(min(2**attempt, 10) + random.random())
         raise RuntimeError("LLM request failed") from last_err
 
+    @staticmethod
+    def _log_cache_usage(usage: Optional[dict]) -> None:
+        """记录服务端前缀缓存命中（DeepSeek: prompt_cache_hit_tokens；OpenAI 兼容: prompt_tokens_details.cached_tokens）
+
+        SYSTEM_PROMPT 固定放在消息最前且逐字节不变，服务端会自动复用这段前缀的缓存。
+        """
+        if not isinstance(usage, dict):
+            return
+        hit = usage.get("prompt_cache_hit_tokens")
+        if hit is None:
+            hit = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        if hit is not None:
+            logging.debug("LLM prompt cache: hit=%s, prompt=%s", hit, usage.get("prompt_tokens"))
+
+    @staticmethod
+    def _retry_after_seconds(resp: requests.Response) -> Optional[float]:
+        """解析 Retry-After（秒数或 HTTP 日期），上限 120 秒；缺失或无法解析时返回 None"""
+        value = (resp.headers.get("Retry-After") or "").strip()
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), 120.0)
+
     @staticmethod
     def _clean_response(text: str) -> str:
         if not text:
             return ""
-        return re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+        return _RE_THINK.sub("", text).strip()
 
     @staticmethod
-    def _extract_json(text: str):
+    def _extract_json(text: str, accept: Optional[Callable[[Any], bool]] = None):
+        """从 LLM 回复中取出 JSON；accept 用于声明期望的结构，解析成功但不符合的片段会被跳过继续找"""
         text = LLMClient._clean_response(text)
         if not text:
             raise ValueError("Empty LLM response")
         # 移除 markdown 代码块标记
-        text = re.sub(r"```json\s*", "", text)
-        text = re.sub(r"```\s*", "", text)
+        text = _RE_JSON_FENCE.sub("", text)
+        text = _RE_FENCE.sub("", text)
         text = text.strip()
         # 直接解析
         try:
-            return json.loads(text)
+            data = _json_loads(text)
         except Exception:
             pass
-        # 尝试找 JSON 数组
-        match = re.search(r"\[[\s\S]*?\](?=\s*$|\s*\n|$)", text, re.S)
-        if match:
+        else:
+            if accept is None or accept(data):
+                return data
+        # 从正文中按出现顺序逐个尝试括号配对的 JSON 片段；
+        # 层层嵌套的畸形片段会被反复解析，累计解析量超过正文 _JSON_PARSE_BUDGET 倍即停，保证线性
+        spans, in_string_openers = _json_spans(text)
+        budget = _JSON_PARSE_BUDGET * len(text)
+        for start, end in spans:
+            budget -= end - start
+            if budget < 0:
+                break
             try:
-                return json.loads(match.group(0))
+                data = _json_loads(text[start:end])
             except Exception:
-                pass
-        # 尝试找 JSON 对象
-        match = re.search(r"\{[\s\S]*?\}(?=\s*$|\s*\n|$)", text, re.S)
-        if match:
+                continue
+            if accept is None or accept(data):
+                return data
+        # 兜底：正文里有落单引号时配对会错位，真正的 JSON 可能被当成了字符串内容，
+        # 对这些括号起点直接解码（忽略尾随文本）。真正的 JSON 通常从第一个被吞的括号开始，
+        # 只试前 _JSON_FALLBACK_TRIES 个，深层嵌套的畸形输出下总耗时仍是线性的
+        for start in in_string_openers[:_JSON_FALLBACK_TRIES]:
             try:
-                return json.loads(match.group(0))
+                data = _JSON_DECODER.raw_decode(text, start)[0]
             except Exception:
-                pass
-        # 最后尝试贪婪匹配
-        match = re.search(r"(\{.*\}|\[.*\])", text, re.S)
-        if not match:
-            raise ValueError("No JSON found in LLM response")
-        return json.loads(match.group(1))
+                continue
+            if accept is None or accept(data):
+                return data
+        raise ValueError("No JSON found in LLM response")
+
+    @staticmethod
+    def _trim_candidate(candidate: dict) -> dict:
+        """只保留选品需要的字段，简介截到 _TRIM_FIELD_CHARS，减少 prompt 体积和 token"""
+        trimmed = {}
+        for key in _TRIM_FIELDS:
+            value = candidate.get(key)
+            if value:
+                if key in _TRIM_TEXT_FIELDS and isinstance(value, str):
+                    value = value[:_TRIM_FIELD_CHARS]
+                trimmed[key] = value
+        return trimmed
 
     def generate_recommendation_prompt(
         self,
@@ -242,7 +393,7 @@ class LLMClient:
             f"请用中文回答。\n\n"
             f"以下是 {len(candidates)} 个产品，来源：{source_name}。\n"
             f"请选择一个最实用的，写一段中文推荐语。\n\n"
-            f"产品列表：\n{json.dumps(candidates, ensure_ascii=False)}\n\n"
+            f"产品列表：\n{_json_dumps(candidates)}\n\n"
             "要求：\n"
             "1. 推荐语必须是中文（60-80字）\n"
             "2. 结构：用户痛点 → 工具方案 → 核心价值\n"
@@ -264,7 +415,7 @@ class LLMClient:
         normalized = content.strip().lower()
         if normalized in {"none", "null", "no", "n/a"}:
             return None
-        data = self._extract_json(content)
+        data = self._extract_json(content, accept=_is_dict)
         if isinstance(data, dict) and data.get("name"):
             return data
         return None
@@ -277,15 +428,17 @@ class LLMClient:
     ) -> Optional[dict]:
         if not candidates:
             return None
-        user_prompt = self.generate_recommendation_prompt(candidates, source_name, extra_instruction)
+        user_prompt = self.generate_recommendation_prompt(
+            [self._trim_candidate(c) for c in candidates], source_name, extra_instruction
+        )
+        # 重试时复用同一份消息，不再每轮重建
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
         best_result = None
         for attempt in range(1, self.max_retries + 1):
-            content = self._request(
-                [
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
-            )
+            content = self._request(messages)
             try:
                 parsed = self.parse_llm_response(content)
                 if parsed:
@@ -318,7 +471,7 @@ class LLMClient:
         user_prompt = (
             f"请用中文回答。你是产品经理，在做竞品分析。\n\n"
             f"以下是 {len(candidates)} 个产品，请选择 {min_items}-{max_items} 个**给最终用户用的**效率工具。\n\n"
-            f"产品列表：\n{json.dumps(candidates, ensure_ascii=False)}\n\n"
+            f"产品列表：\n{_json_dumps(candidates)}\n\n"
             "【接受 - 最终用户工具】\n"
             "文档协作、会议、PPT、表格、项目管理、图片视频生成、设计、建站\n\n"
             "【拒绝 - 开发者工具 → 返回 NULL】\n"
@@ -339,7 +492,8 @@ class LLMClient:
                 ]
             )
             try:
-                data = self._extract_json(content)
+                # 正文里的 [1] 之类片段不是候选数组，跳过继续找，免得白白消耗一次重试
+                data = self._extract_json(content, accept=_is_dict_list)
                 if isinstance(data, list):
                     valid_items = []
                     for item in data:
@@ -61,22 +61,20 @@ def run_daily_job(
     logging.info("History loaded: %d items", history.get_stats()["total"])
 
     try:
-        llm = LLMClient(api_key=api_key, base_url=base_url, model=model)
-
-        with Scraper(headless=True) as scraper:
-            curator = Curator(
+        with LLMClient(api_key=api_key, base_url=base_url, model=model) as llm, Scraper(headless=True) as scraper:
+            with Curator(
                 scraper=scraper,
                 llm=llm,
                 store_path=os.path.join(os.path.dirname(__file__), "recommendations.json"),
                 history=history,  # 传入历史管理器
-            )
-            logging.info("正在抓取今日新品...")
-            products = curator.get_today_news()
-            logging.info("新品抓取完成: %s 条", len(products))
+            ) as curator:
+                logging.info("正在抓取今日新品...")
+                products = curator.get_today_news()
+                logging.info("新品抓取完成: %s 条", len(products))
 
-            logging.info("正在生成精选推荐...")
-            curated = curator.curate()
-            logging.info("精选推荐完成: %s 条", len(curated))
+                logging.info("正在生成精选推荐...")
+                curated = curator.curate(today=products)
+                logging.info("精选推荐完成: %s 条", len(curated))
 
             report_md = generate_markdown(products, curated)
 
@@ -110,8 +108,8 @@ def run_daily_job(
                 webhook_urls.append(env_webhook)
         
         if send_webhook and webhook_urls:
-            notifier = Notifier(webhook_url=webhook_urls)
-            notifier.send_markdown(report_md)
+            with Notifier(webhook_url=webhook_urls) as notifier:
+                notifier.send_markdown(report_md)
         return report_md, path
     finally:
         if handler:
@@ -127,8 +125,14 @@ def run_scheduler(at_time: str = "09:00", output_dir: str = "reports") -> None:
     schedule.every().day.at(at_time).do(run_once, output_dir=output_dir)
     logging.info("Scheduler started. Daily report at %s", at_time)
     while True:
+        # 直接睡到下一个任务到期（最多 1 小时，防止系统休眠/改时钟后睡过头），不再每 30 秒轮询
+        idle = schedule.idle_seconds()
+        if idle is None:
+            time.sleep(60)
+            continue
+        if idle > 0:
+            time.sleep(min(idle, 3600))
         schedule.run_pending()
-        time.sleep(30)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # 可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# 降级纯文本消息的长度上限
+_FALLBACK_TEXT_CHARS = 1500
+
+
+def _encode_payload(payload: dict) -> bytes:
+    if orjson:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
 
 class Notifier:
     """支持多个 Webhook 的通知器"""
@@ -17,6 +34,17 @@ class Notifier:
         else:
             self.webhook_urls = [url for url in webhook_url if url and url.strip()]
         self.timeout = timeout
+        # 多个 Webhook / 降级重发共用连接池
+        self._session = requests.Session()
+
+    def __enter__(self) -> "Notifier":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._session.close()
 
     def send_markdown(self, markdown: str) -> bool:
         """向所有配置的 Webhook 发送消息"""
@@ -24,19 +52,21 @@ class Notifier:
             logging.warning("No webhook URLs configured")
             return False
         
-        success_count = 0
-        for url in self.webhook_urls:
-            if self._send_to_webhook(url, markdown):
-                success_count += 1
+        # 正文与降级纯文本只序列化一次，所有 Webhook 共用
+        primary = _encode_payload({"msgtype": "markdown", "markdown": {"text": markdown}})
+        fallback = _encode_payload({"msgtype": "text", "text": {"content": markdown[:_FALLBACK_TEXT_CHARS]}})
+        # 各 Webhook 互不依赖，并发发送；总耗时取决于最慢的一个而不是逐个累加
+        with ThreadPoolExecutor(max_workers=len(self.webhook_urls)) as pool:
+            results = list(pool.map(lambda url: self._send_to_webhook(url, primary, fallback), self.webhook_urls))
+        success_count = sum(results)
         
         logging.info("Webhook sent to %d/%d endpoints", success_count, len(self.webhook_urls))
         return success_count > 0
     
-    def _send_to_webhook(self, url: str, markdown: str) -> bool:
-        """向单个 Webhook 发送消息"""
-        payload = {"msgtype": "markdown", "markdown": {"text": markdown}}
+    def _send_to_webhook(self, url: str, primary: bytes, fallback: bytes) -> bool:
+        """向单个 Webhook 发送消息（primary / fallback 为已序列化的 JSON）"""
         try:
-            resp = requests.post(url, json=payload, timeout=self.timeout)
+            resp = self._session.post(url, data=primary, headers=_JSON_HEADERS, timeout=self.timeout)
             resp.raise_for_status()
             return True
         except Exception as exc:  # noqa: BLE001
@@ -44,8 +74,7 @@ class Notifier:
             time.sleep(1)
             try:
                 # 降级为纯文本
-                payload = {"msgtype": "text", "text": {"content": markdown[:1500]}}
-                resp = requests.post(url, json=payload, timeout=self.timeout)
+                resp = self._session.post(url, data=fallback, headers=_JSON_HEADERS, timeout=self.timeout)
                 resp.raise_for_status()
                 return True
             except Exception as exc2:  # noqa: BLE001
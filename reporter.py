@@ -4,6 +4,10 @@ import re
 from datetime import datetime
 from typing import Iterable, List
 
+# _clean_for_display 使用的正则，模块加载时编译一次
+_RE_TIME_AGO = re.compile(r'\d+\s*(days?|hours?|minutes?)\s*ago', re.I)
+_RE_METADATA = re.compile(r'(Discussion|Comments?|Link|Source:)[^\n]*', re.I)
+
 
 def _clean_for_display(text: str) -> str:
     """清理文本，移除元数据噪音"""
@@ -11,11 +15,11 @@ def _clean_for_display(text: str) -> str:
         return ""
     cleaned = text
     # 移除时间戳
-    cleaned = re.sub(r'\d+\s*(days?|hours?|minutes?)\s*ago', '', cleaned, flags=re.I)
+    cleaned = _RE_TIME_AGO.sub('', cleaned)
     # 移除元数据
-    cleaned = re.sub(r'(Discussion|Comments?|Link|Source:)[^\n]*', '', cleaned, flags=re.I)
-    # 移除多余空白
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = _RE_METADATA.sub('', cleaned)
+    # 折叠多余空白（str.split 与 \s 的空白定义一致）
+    cleaned = ' '.join(cleaned.split())
     return cleaned
 
 
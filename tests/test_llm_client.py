@@ -0,0 +1,74 @@
+"""LLMClient._extract_json 回归测试：常见回复格式 + 畸形长输出的耗时上限"""
+
+import time
+import unittest
+from unittest import mock
+
+import llm_client
+from llm_client import LLMClient
+
+# 畸形输入约 100KB；线性扫描在毫秒级，平方级退化会到几十秒
+_PATHOLOGICAL_N = 30_000
+_TIME_LIMIT = 1.0
+
+
+class ExtractJsonTest(unittest.TestCase):
+    def test_fenced_json(self):
+        text = '好的：\n```json\n[{"name": "A", "url": "https://a.com"}]\n```'
+        self.assertEqual(LLMClient._extract_json(text), [{"name": "A", "url": "https://a.com"}])
+
+    def test_think_block_is_ignored(self):
+        text = '<think>[先想想]</think>{"name": "B"}'
+        self.assertEqual(LLMClient._extract_json(text), {"name": "B"})
+
+    def test_stray_quote_before_array(self):
+        # 落单引号让配对错位，真正的数组被当成了字符串内容
+        text = '工具{!"　。AI[{"name": "C"}]-说明'
+        self.assertEqual(LLMClient._extract_json(text), [{"name": "C"}])
+
+    def test_json_followed_by_prose_on_same_line(self):
+        text = '结果 {"name": "D", "q": "含 } 括号"} 希望有帮助'
+        self.assertEqual(LLMClient._extract_json(text), {"name": "D", "q": "含 } 括号"})
+
+    def test_accept_skips_unexpected_container(self):
+        text = '注意[1]：\n[{"name": "E"}]'
+        self.assertEqual(LLMClient._extract_json(text), [1])
+        self.assertEqual(
+            LLMClient._extract_json(text, accept=llm_client._is_dict_list), [{"name": "E"}]
+        )
+
+    def test_no_json_raises(self):
+        with self.assertRaises(ValueError):
+            LLMClient._extract_json("没有任何 JSON")
+
+    def _assert_fast_failure(self, text):
+        start = time.perf_counter()
+        with self.assertRaises(ValueError):
+            LLMClient._extract_json(text)
+        self.assertLess(time.perf_counter() - start, _TIME_LIMIT)
+
+    def test_unterminated_escaped_quotes_is_linear(self):
+        self._assert_fast_failure('{"' + '\\" ' * _PATHOLOGICAL_N)
+
+    def test_brackets_inside_unterminated_string_is_linear(self):
+        self._assert_fast_failure('{"' + "[" * _PATHOLOGICAL_N)
+
+    def test_nested_invalid_arrays_is_linear(self):
+        n = _PATHOLOGICAL_N
+        self._assert_fast_failure("[" * n + "1," * n + "x" + "]" * n)
+
+
+class SelectTopNTest(unittest.TestCase):
+    def test_skips_non_candidate_array_without_retry(self):
+        client = LLMClient(api_key="k", base_url="http://llm.invalid", model="m")
+        intro = "每天整理会议纪要要花一小时，这个工具自动转写并提炼待办，会后直接分发给团队，省时又不漏事。"
+        content = '注意[1]：\n[{"name": "F", "url": "u", "one_sentence_intro_cn": "%s", "origin": "CN"}]' % intro
+        with mock.patch.object(client, "_request", return_value=content) as request:
+            picks = client.select_top_n([{"name": "F"}], min_items=1, max_items=1)
+        client.close()
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual([p["name"] for p in picks], ["F"])
+
+
+if __name__ == "__main__":
+    unittest.main()